@@ -12,83 +12,77 @@ bl_info = {
 
 import bpy
 import sys
-import traceback
+import logging
+
+# Quiet by default: operator modules log through this package logger and
+# only format tracebacks when a handler/level actually wants them
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 # Debug mode flag
 DEBUG = True
 
-def debug_print(msg):
-    """Print debug messages"""
-    if DEBUG:
+if DEBUG:
+    def debug_print(msg):
+        """Print debug messages"""
         print(f"[TIPPY DEBUG] {msg}")
+else:
+    def debug_print(msg):
+        """No-op when debug mode is disabled"""
+        pass
 
-def register():
-    debug_print("="*50)
-    debug_print("Starting Tippy Blender Link registration...")
-    debug_print(f"Python version: {sys.version}")
-    debug_print(f"Blender version: {bpy.app.version_string}")
-    debug_print(f"Module name: {__name__}")
-    debug_print(f"Package: {__package__}")
-    
-    try:
+# Submodules resolved once on first register() and reused afterwards,
+# so unregister()/re-register don't walk the importer again
+_SUBMODULES = None
+
+def _get_submodules():
+    """Import submodules once and cache them at module scope"""
+    global _SUBMODULES
+    if _SUBMODULES is None:
         debug_print("Importing modules...")
-        from . import preferences
+        from . import preferences, scene_properties, operators, panels, config
         debug_print(f"  Preferences module: {preferences}")
-        
-        from . import scene_properties
         debug_print(f"  Scene properties module: {scene_properties}")
-        
-        from . import operators
         debug_print(f"  Operators module: {operators}")
-        
-        from . import panels
         debug_print(f"  Panels module: {panels}")
-        
-        from . import config
         debug_print(f"  Config module: {config}")
         debug_print(f"  Firebase config template loaded")
-        
-    except Exception as e:
-        debug_print(f"ERROR during imports: {e}")
-        debug_print(traceback.format_exc())
-        raise
-    
-    try:
-        debug_print("Registering scene properties...")
-        scene_properties.register()
-        debug_print("  ✓ Scene properties registered")
-    except Exception as e:
-        debug_print(f"ERROR registering scene properties: {e}")
-        debug_print(traceback.format_exc())
-        raise
-    
-    try:
-        debug_print("Registering preferences...")
-        preferences.register()
-        debug_print("  ✓ Preferences registered")
-    except Exception as e:
-        debug_print(f"ERROR registering preferences: {e}")
-        debug_print(traceback.format_exc())
-        raise
-    
-    try:
-        debug_print("Registering operators...")
-        operators.register()
-        debug_print("  ✓ Operators registered")
-    except Exception as e:
-        debug_print(f"ERROR registering operators: {e}")
-        debug_print(traceback.format_exc())
-        raise
+        _SUBMODULES = (preferences, scene_properties, operators, panels, config)
+    return _SUBMODULES
+
+def register():
+    if DEBUG:
+        debug_print("="*50)
+        debug_print("Starting Tippy Blender Link registration...")
+        debug_print(f"Python version: {sys.version}")
+        debug_print(f"Blender version: {bpy.app.version_string}")
+        debug_print(f"Module name: {__name__}")
+        debug_print(f"Package: {__package__}")
     
     try:
-        debug_print("Registering panels...")
-        panels.register()
-        debug_print("  ✓ Panels registered")
+        preferences, scene_properties, operators, panels, config = _get_submodules()
     except Exception as e:
-        debug_print(f"ERROR registering panels: {e}")
+        import traceback
+        debug_print(f"ERROR during imports: {e}")
         debug_print(traceback.format_exc())
         raise
     
+    steps = (
+        ("scene properties", scene_properties),
+        ("preferences", preferences),
+        ("operators", operators),
+        ("panels", panels),
+    )
+    for label, mod in steps:
+        try:
+            debug_print(f"Registering {label}...")
+            mod.register()
+            debug_print(f"  ✓ {label.capitalize()} registered")
+        except Exception as e:
+            import traceback
+            debug_print(f"ERROR registering {label}: {e}")
+            debug_print(traceback.format_exc())
+            raise
+
     debug_print("✓ Tippy Blender Link registered successfully!")
     debug_print("="*50)
 
@@ -97,8 +91,8 @@ def unregister():
     debug_print("Unregistering Tippy Blender Link...")
     
     try:
-        from . import panels, operators, preferences, scene_properties
-        
+        preferences, scene_properties, operators, panels, config = _get_submodules()
+
         panels.unregister()
         debug_print("  ✓ Panels unregistered")
         
@@ -110,8 +104,16 @@ def unregister():
         
         scene_properties.unregister()
         debug_print("  ✓ Scene properties unregistered")
+
+        # validation attaches a depsgraph handler lazily on first use;
+        # only detach it if the module was actually imported
+        validation = sys.modules.get(__name__ + ".utils.validation")
+        if validation is not None:
+            validation.remove_invalidation_handler()
+            debug_print("  ✓ Validation handler removed")
         
     except Exception as e:
+        import traceback
         debug_print(f"ERROR during unregister: {e}")
         debug_print(traceback.format_exc())
     
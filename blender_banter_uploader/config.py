@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 # Firebase configuration template
 # Users should fill these values in the addon preferences
 FIREBASE_CONFIG_TEMPLATE = {
@@ -13,64 +15,58 @@ FIREBASE_CONFIG_TEMPLATE = {
 MAX_FILE_SIZE_MB = 40
 TEMP_DIR = None  # Use system temp
 
+# Keys shared by every preset; built once so the three presets don't
+# each repeat the same 12-entry literal at import time
+_BASE_PRESET = {
+    'export_format': 'GLB',
+    'export_image_format': 'AUTO',
+    'export_texture_dir': '',
+    'export_texcoords': True,
+    'export_normals': True,
+    'export_materials': 'EXPORT',
+    'export_colors': True,
+    'export_cameras': False,
+    'export_lights': False,
+    'export_animations': True,
+    'export_frame_range': False,
+    'export_apply': True,
+}
+
+# Presets are frozen read-only templates; callers copy on demand with
+# dict(preset) / preset.copy() when they need a writable settings dict
 EXPORT_PRESETS = {
-    "mobile_vr": {
-        'export_format': 'GLB',
-        'export_image_format': 'AUTO',
-        'export_texture_dir': '',
-        'export_texcoords': True,
-        'export_normals': True,
-        'export_materials': 'EXPORT',
-        'export_colors': True,
-        'export_cameras': False,
-        'export_lights': False,
-        'export_animations': True,
-        'export_frame_range': False,
-        'export_apply': True,
+    "mobile_vr": MappingProxyType(_BASE_PRESET | {
         'export_draco_mesh_compression_enable': True,
         'export_draco_mesh_compression_level': 6,
         'export_image_quality': 75,
         'export_texture_size_limit': 1024,
-    },
-    "pc_vr": {
-        'export_format': 'GLB',
-        'export_image_format': 'AUTO',
-        'export_texture_dir': '',
-        'export_texcoords': True,
-        'export_normals': True,
-        'export_materials': 'EXPORT',
-        'export_colors': True,
-        'export_cameras': False,
-        'export_lights': False,
-        'export_animations': True,
-        'export_frame_range': False,
-        'export_apply': True,
+    }),
+    "pc_vr": MappingProxyType(_BASE_PRESET | {
         'export_draco_mesh_compression_enable': True,
         'export_draco_mesh_compression_level': 4,
         'export_image_quality': 85,
         'export_texture_size_limit': 2048,
-    },
-    "high_quality": {
-        'export_format': 'GLB',
-        'export_image_format': 'AUTO',
-        'export_texture_dir': '',
-        'export_texcoords': True,
-        'export_normals': True,
-        'export_materials': 'EXPORT',
-        'export_colors': True,
-        'export_cameras': False,
-        'export_lights': False,
-        'export_animations': True,
-        'export_frame_range': False,
-        'export_apply': True,
+    }),
+    "high_quality": MappingProxyType(_BASE_PRESET | {
         'export_draco_mesh_compression_enable': False,
         'export_image_quality': 95,
         'export_texture_size_limit': 4096,
-    }
+    })
 }
 
 DEFAULT_EXPORT_PRESET = "mobile_vr"
 
+# Shared EnumProperty items: one interned tuple instead of a list
+# literal rebuilt in every module that declares a preset property
+PRESET_ITEMS = (
+    ('mobile_vr', "Mobile VR", "Optimized for Quest and mobile devices"),
+    ('pc_vr', "PC VR", "Balanced quality for PC VR"),
+    ('high_quality', "High Quality", "Maximum quality for hero assets"),
+)
+PRESET_ITEMS_WITH_CUSTOM = PRESET_ITEMS + (
+    ('custom', "Custom", "Use custom export settings"),
+)
+
 # Validation thresholds
 MAX_POLY_COUNT_MOBILE_VR = 100000
 MAX_POLY_COUNT_PC_VR = 500000
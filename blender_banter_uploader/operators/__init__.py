@@ -1,16 +1,19 @@
 import bpy
+from . import export_upload
 from .export_upload import TIPPY_OT_export_upload
 from .batch_export import TIPPY_OT_batch_export
 
-classes = [
+classes = (
     TIPPY_OT_export_upload,
     TIPPY_OT_batch_export,
-]
+)
+
+# C-side loop over the tuple; no per-class Python dispatch at enable time
+register, _unregister_classes = bpy.utils.register_classes_factory(classes)
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
\ No newline at end of file
+    _unregister_classes()
+    # Drop the lazily-added depsgraph handler and its cached exports so
+    # nothing from this (soon-dead) module keeps running
+    export_upload.clear_glb_cache()
@@ -1,11 +1,17 @@
 import bpy
+import hashlib
+import io
+import os
 from bpy.types import Operator
 from bpy.props import StringProperty, EnumProperty, BoolProperty
-import traceback
-from ..utils import GLBExporter, ValidationHelper
-from ..utils.firebase_client import FirebaseClient, get_transform_data
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import logging
+from ..scene_properties import set_batch_results
 from .. import config
 
+log = logging.getLogger(__name__)
+
 class TIPPY_OT_batch_export(Operator):
     """Export multiple objects as separate GLB files and upload to Firebase"""
     bl_idname = "tippy.batch_export"
@@ -20,6 +26,7 @@ class TIPPY_OT_batch_export(Operator):
             ('individual', "Individual Objects", "Export each object separately"),
             ('collections', "By Collection", "Export each collection as one GLB"),
             ('hierarchy', "Top-Level Only", "Export top-level objects with children"),
+            ('combined', "Combined", "Export entire selection as one GLB (single exporter pass)"),
         ],
         default='individual'
     )
@@ -27,11 +34,7 @@ class TIPPY_OT_batch_export(Operator):
     export_preset: EnumProperty(
         name="Export Preset",
         description="Preset configuration for export",
-        items=[
-            ('mobile_vr', "Mobile VR", "Optimized for Quest and mobile devices"),
-            ('pc_vr', "PC VR", "Balanced quality for PC VR"),
-            ('high_quality', "High Quality", "Maximum quality for hero assets"),
-        ],
+        items=config.PRESET_ITEMS,
         default='mobile_vr'
     )
     
@@ -43,12 +46,23 @@ class TIPPY_OT_batch_export(Operator):
     
     def execute(self, context):
         try:
+            # Deferred import keeps the requests/HTTP stack off the addon
+            # registration path; sys.modules makes repeat calls cheap
+            from ..utils import GLBExporter, ValidationHelper
+            from ..utils.firebase_client import (
+                FirebaseClient, get_transform_data, generate_component_id
+            )
+
+            # Snapshot the selection once; context.selected_objects walks the
+            # RNA layer on every access
+            selected = list(context.selected_objects)
+
             # Determine what to export based on mode
             export_items = []
             
             if self.export_mode == 'individual':
                 # Export each selected object separately
-                for obj in context.selected_objects:
+                for obj in selected:
                     export_items.append({
                         'name': obj.name,
                         'objects': [obj]
@@ -56,39 +70,46 @@ class TIPPY_OT_batch_export(Operator):
                     
             elif self.export_mode == 'collections':
                 # Group by collection
-                collections_dict = {}
-                for obj in context.selected_objects:
+                collections_dict = defaultdict(list)
+                for obj in selected:
                     for col in obj.users_collection:
-                        if col.name not in collections_dict:
-                            collections_dict[col.name] = []
                         collections_dict[col.name].append(obj)
                 
-                for col_name, objects in collections_dict.items():
-                    export_items.append({
-                        'name': col_name,
-                        'objects': objects
-                    })
+                export_items = [
+                    {'name': col_name, 'objects': objects}
+                    for col_name, objects in collections_dict.items()
+                ]
                     
             elif self.export_mode == 'hierarchy':
                 # Only export top-level objects (with their children)
-                top_level = [obj for obj in context.selected_objects if obj.parent not in context.selected_objects]
+                selected_set = set(selected)
+                top_level = [obj for obj in selected if obj.parent not in selected_set]
                 
                 for obj in top_level:
                     # Get object and all children
-                    objects = [obj]
-                    objects.extend(self.get_all_children(obj))
+                    objects = [obj, *self.iter_descendants(obj)]
                     
                     export_items.append({
                         'name': obj.name,
                         'objects': objects
                     })
+
+            elif self.export_mode == 'combined':
+                # One exporter pass for the whole selection; the gltf
+                # addon's scene walk dominates per-call cost, so sharing
+                # it beats N individual exports when grouping isn't needed
+                export_items.append({
+                    'name': f"Combined_{len(selected)}_objects",
+                    'objects': selected
+                })
             
             if not export_items:
                 self.report({'ERROR'}, "No objects to export")
                 return {'CANCELLED'}
             
-            # Get settings
-            settings = config.EXPORT_PRESETS[self.export_preset].copy()
+            # Get settings; presets are frozen read-only templates and the
+            # export path never mutates them, so no per-run copy is needed
+            settings = config.EXPORT_PRESETS[self.export_preset]
             prefs = context.preferences.addons["blender_banter_uploader"].preferences
 
             # Build Firebase config
@@ -102,129 +123,289 @@ class TIPPY_OT_batch_export(Operator):
                 'databaseURL': prefs.firebase_database_url
             }
 
-            # Check configuration
-            if not prefs.firebase_database_url or not prefs.firebase_storage_bucket:
+            # Check configuration (reuse the values already pulled out of
+            # the RNA preferences instead of re-walking the chain)
+            space_id = prefs.space_id
+
+            if not firebase_config['databaseURL'] or not firebase_config['storageBucket']:
                 self.report({'ERROR'}, "Firebase configuration incomplete. Please configure in addon preferences.")
                 return {'CANCELLED'}
 
-            if not prefs.space_id:
+            if not space_id:
                 self.report({'ERROR'}, "No Space ID configured. Please set Space ID in addon preferences.")
                 return {'CANCELLED'}
 
             # Initialize Firebase client
-            client = FirebaseClient(firebase_config, prefs.space_id)
+            client = FirebaseClient(firebase_config, space_id)
             
             # Process each item
             successful = []
             failed = []
-            
-            for i, item in enumerate(export_items):
-                self.report({'INFO'}, f"Processing {i+1}/{len(export_items)}: {item['name']}")
-                
-                try:
-                    # Validate
-                    is_valid, warnings, errors = ValidationHelper.validate_for_preset(
-                        item['objects'],
-                        self.export_preset
-                    )
-                    
-                    if not is_valid and not self.skip_failed:
-                        for error in errors:
-                            self.report({'ERROR'}, f"{item['name']}: {error}")
-                        return {'CANCELLED'}
-                    elif not is_valid:
-                        failed.append(item['name'])
-                        for error in errors:
-                            self.report({'WARNING'}, f"{item['name']}: {error}")
-                        continue
-                    
-                    # Export
-                    filepath, glb_data = GLBExporter.export_selection(
-                        item['objects'],
-                        settings=settings
-                    )
-                    
-                    # Check size
-                    size_mb = len(glb_data) / (1024 * 1024)
-                    if size_mb > config.MAX_FILE_SIZE_MB:
-                        if not self.skip_failed:
-                            self.report({'ERROR'}, f"{item['name']}: File too large ({size_mb:.1f}MB)")
-                            return {'CANCELLED'}
-                        else:
-                            failed.append(item['name'])
-                            self.report({'WARNING'}, f"{item['name']}: File too large ({size_mb:.1f}MB)")
-                            continue
-                    
-                    # Get transform data from first object in the group
-                    transform = None
-                    if item['objects']:
-                        transform = get_transform_data(item['objects'][0])
-
-                    # Upload to Firebase with mesh name
-                    result = client.upload_with_retry(
-                        glb_data,
-                        mesh_name=item['name'],  # Use the item name as mesh name
-                        transform=transform,
-                        max_retries=prefs.max_retries
-                    )
 
-                    if not result.get('success'):
-                        raise Exception(result.get('error', 'Unknown error'))
+            # Hoist per-iteration attribute lookups out of the loop
+            report = self.report
+            skip_failed = self.skip_failed
+            max_size_mb = config.MAX_FILE_SIZE_MB
 
-                    storage_url = result.get('storage_url', 'unknown')
-                    component_id = result.get('component_id', 'unknown')
+            # Validation results repeat across items with identical
+            # inputs, but the verdict depends on more than mesh data:
+            # modifiers and object-linked material slots feed the
+            # warnings and size estimate too, so the key carries a
+            # per-object signature of all three
+            validation_cache = {}
 
-                    successful.append({
-                        'name': item['name'],
-                        'url': storage_url,
-                        'component_id': component_id,
-                        'size': size_mb
-                    })
+            def _validation_key(objects):
+                return tuple(sorted(
+                    (
+                        o.data.name,
+                        tuple(m.type for m in o.modifiers),
+                        tuple(
+                            slot.material.name if slot.material else ''
+                            for slot in o.material_slots
+                        ),
+                    )
+                    for o in objects if o.type == 'MESH'
+                ))
 
-                    self.report({'INFO'}, f"{item['name']}: Uploaded successfully to Firebase")
-                    
-                except Exception as e:
-                    if not self.skip_failed:
-                        self.report({'ERROR'}, f"{item['name']}: {str(e)}")
+            # One RNA pass over every object in the batch; validation and
+            # the poly-budget prefilter below reuse these counts instead
+            # of re-reading len(obj.data.polygons) per item
+            mesh_stats = ValidationHelper.get_mesh_stats(
+                o for item in export_items for o in item['objects']
+            )
+
+            # Items already over the preset poly budget can't meet the
+            # preset; fail them up front instead of paying the
+            # Draco-compressed export first
+            poly_limit = {
+                'mobile_vr': config.MAX_POLY_COUNT_MOBILE_VR,
+                'pc_vr': config.MAX_POLY_COUNT_PC_VR,
+            }.get(self.export_preset)
+
+            if poly_limit is not None:
+                exportable = []
+                for item in export_items:
+                    poly_count = sum(
+                        mesh_stats[o][0]
+                        for o in item['objects'] if o in mesh_stats
+                    )
+                    if poly_count <= poly_limit:
+                        exportable.append(item)
+                    elif not skip_failed:
+                        report({'ERROR'}, f"{item['name']}: Polygon count ({poly_count:,}) exceeds preset limit ({poly_limit:,})")
                         return {'CANCELLED'}
                     else:
                         failed.append(item['name'])
-                        self.report({'WARNING'}, f"{item['name']}: {str(e)}")
-            
-            # Report results
-            self.report({'INFO'}, f"Batch export complete: {len(successful)} successful, {len(failed)} failed")
-            
-            # Store results in scene using proper Blender properties
-            # Clear previous results
-            context.scene.tippy_batch_results.clear()
+                        report({'WARNING'}, f"{item['name']}: Skipped, polygon count ({poly_count:,}) exceeds preset limit ({poly_limit:,})")
+                export_items = exportable
+
+            total = len(export_items)
+
+            # Exports must stay on the main thread (bpy.ops is not
+            # thread-safe), but the uploads are pure network I/O, so they
+            # overlap on a small thread pool while the next item exports
+            max_retries = prefs.max_retries
+            # First upload future per content digest; byte-identical GLBs
+            # (instanced props) reuse its storage URL instead of
+            # re-uploading the payload
+            digest_futures = {}
+            preset = self.export_preset
+            validate = ValidationHelper.validate_for_preset
+            export_fn = GLBExporter.export_selection
+            upload_futures = []
+            # Cap in-flight uploads so a big batch doesn't hold every
+            # exported GLB in memory at once
+            pending = set()
+            max_pending = 8
+
+            # Cursor-based progress counter instead of a per-item INFO
+            # report; self.report pushes into the info log and forces
+            # header redraws on every call
+            wm = context.window_manager
+            wm.progress_begin(0, total)
+
+            try:
+                with ThreadPoolExecutor(max_workers=4) as pool:
+                    for i, item in enumerate(export_items):
+                        wm.progress_update(i)
+
+                        if len(pending) >= max_pending:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                        try:
+                            # Validate (memoized across identical items)
+                            val_key = _validation_key(item['objects'])
+                            cached = validation_cache.get(val_key)
+                            if cached is None:
+                                cached = validate(
+                                    item['objects'],
+                                    preset,
+                                    mesh_stats=mesh_stats
+                                )
+                                validation_cache[val_key] = cached
+                            is_valid, warnings, errors = cached
 
-            # Add new results
-            for item in successful:
-                result_item = context.scene.tippy_batch_results.add()
-                result_item.name = item['name']
-                result_item.hash = item['url']  # Store URL in hash field for compatibility
-                result_item.size = item['size']
+                            if not is_valid and not skip_failed:
+                                for error in errors:
+                                    report({'ERROR'}, f"{item['name']}: {error}")
+                                return {'CANCELLED'}
+                            elif not is_valid:
+                                failed.append(item['name'])
+                                for error in errors:
+                                    report({'WARNING'}, f"{item['name']}: {error}")
+                                continue
+
+                            # Export, leaving the GLB on disk so the upload
+                            # can stream it instead of holding bytes in RAM
+                            filepath, _ = export_fn(
+                                item['objects'],
+                                settings=settings,
+                                return_bytes=False
+                            )
+
+                            # Check size
+                            size_mb = os.path.getsize(filepath) / (1024 * 1024)
+                            if size_mb > max_size_mb:
+                                try:
+                                    os.remove(filepath)
+                                except OSError:
+                                    pass
+                                if not skip_failed:
+                                    report({'ERROR'}, f"{item['name']}: File too large ({size_mb:.1f}MB)")
+                                    return {'CANCELLED'}
+                                else:
+                                    failed.append(item['name'])
+                                    report({'WARNING'}, f"{item['name']}: File too large ({size_mb:.1f}MB)")
+                                    continue
+
+                            # Get transform data from first object in the group
+                            transform = None
+                            if item['objects']:
+                                transform = get_transform_data(item['objects'][0])
+
+                            # Content digest for payload dedup (streamed)
+                            hasher = hashlib.sha256()
+                            with open(filepath, 'rb') as f:
+                                for chunk in iter(lambda: f.read(1 << 20), b''):
+                                    hasher.update(chunk)
+                            digest = hasher.digest()
+
+                            first = digest_futures.get(digest)
+                            if first is None:
+                                # Dispatch the storage upload and move on to
+                                # the next export; the worker streams from
+                                # disk and removes the temp file. The dedup
+                                # digest doubles as the storage name, so the
+                                # worker skips its own hash pass. Database
+                                # records are written in one batch below.
+                                future = pool.submit(
+                                    client.upload_file_with_retry,
+                                    filepath,
+                                    max_retries,
+                                    precomputed_sha256=digest.hex()
+                                )
+                                digest_futures[digest] = future
+                            else:
+                                # Same payload already uploading: storage is
+                                # content-addressed, so this item shares the
+                                # first upload's future outright and only
+                                # contributes its own component/entity
+                                # records to the batch write below
+                                try:
+                                    os.remove(filepath)
+                                except OSError:
+                                    pass
+                                future = first
+
+                            upload_futures.append(
+                                (item['name'], size_mb, transform, future)
+                            )
+                            pending.add(future)
+
+                        except Exception as e:
+                            if not skip_failed:
+                                report({'ERROR'}, f"{item['name']}: {str(e)}")
+                                return {'CANCELLED'}
+                            else:
+                                failed.append(item['name'])
+                                report({'WARNING'}, f"{item['name']}: {str(e)}")
+
+                    # Collect storage results in submission order; all
+                    # database records then land in a single multi-path
+                    # PATCH instead of two writes per item
+                    entries = []
+                    uploaded = []
+                    for name, size_mb, transform, future in upload_futures:
+                        try:
+                            success, url_or_error = future.result()
+                            if not success:
+                                raise Exception(url_or_error)
+                            component_id = generate_component_id()
+                            entries.append({
+                                'mesh_name': name,
+                                'component_id': component_id,
+                                'storage_url': url_or_error,
+                                'transform': transform,
+                            })
+                            uploaded.append(
+                                (name, url_or_error, component_id, size_mb)
+                            )
+                        except Exception as e:
+                            failed.append(name)
+                            report({'WARNING'}, f"{name}: {str(e)}")
+
+                    if entries:
+                        ok, message = client.batch_write_entities(entries)
+                        if ok:
+                            successful.extend(uploaded)
+                        else:
+                            # The storage objects exist but no records
+                            # point at them; every item in the batch
+                            # write fails together
+                            failed.extend(name for name, _, _, _ in uploaded)
+                            report({'WARNING'}, f"Batch database write failed: {message}")
+            finally:
+                wm.progress_end()
+                # Shut down the client's worker threads and sockets now;
+                # __del__ covers the early-return paths
+                client.close()
+
+            # Single summary report; the per-item chatter is gone
+            report({'INFO'}, f"Batch export complete: {len(successful)} successful, {len(failed)} failed")
+            
+            # Store results in the scene with a single JSON property
+            # write, so RNA update notifications fire once at the end
+            set_batch_results(context.scene, [
+                {
+                    'name': name,
+                    'hash': url,  # Store URL in hash field for compatibility
+                    'size_kb': int(size_mb * 1024),
+                    'component_id': component_id,
+                }
+                for name, url, component_id, size_mb in successful
+            ])
 
             # Copy all URLs to clipboard
             if successful:
-                urls = [f"{item['name']}: {item['url']}" for item in successful]
-                context.window_manager.clipboard = "\n".join(urls)
-                self.report({'INFO'}, "All URLs copied to clipboard")
+                buf = io.StringIO()
+                buf.writelines(f"{name}: {url}\n" for name, url, _, _ in successful)
+                context.window_manager.clipboard = buf.getvalue()
+                report({'INFO'}, "All URLs copied to clipboard")
             
             return {'FINISHED'}
             
         except Exception as e:
             self.report({'ERROR'}, f"Batch export failed: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Batch export failed")
             return {'CANCELLED'}
     
-    def get_all_children(self, obj):
-        """Recursively get all children of an object"""
-        children = []
-        for child in obj.children:
-            children.append(child)
-            children.extend(self.get_all_children(child))
-        return children
+    def iter_descendants(self, obj):
+        """Yield all descendants of an object via an explicit stack walk"""
+        stack = list(obj.children)
+        while stack:
+            child = stack.pop()
+            yield child
+            stack.extend(child.children)
     
     def invoke(self, context, event):
         # Check if multiple objects selected
@@ -241,18 +422,22 @@ class TIPPY_OT_batch_export(Operator):
         layout.prop(self, "skip_failed")
         
         # Show selection info
-        selected_count = len(context.selected_objects)
+        selected = tuple(context.selected_objects)
+        selected_count = len(selected)
         layout.separator()
         layout.label(text=f"Selected: {selected_count} object(s)")
         
         # Preview what will be exported
         if self.export_mode == 'collections':
             collections = set()
-            for obj in context.selected_objects:
+            for obj in selected:
                 collections.update(col.name for col in obj.users_collection)
             layout.label(text=f"Will export {len(collections)} collection(s)")
         elif self.export_mode == 'hierarchy':
-            top_level = [obj for obj in context.selected_objects if obj.parent not in context.selected_objects]
+            selected_set = set(selected)
+            top_level = [obj for obj in selected if obj.parent not in selected_set]
             layout.label(text=f"Will export {len(top_level)} top-level object(s)")
+        elif self.export_mode == 'combined':
+            layout.label(text="Will export 1 combined GLB")
         else:
             layout.label(text=f"Will export {selected_count} individual object(s)")
\ No newline at end of file
@@ -1,11 +1,73 @@
 import bpy
+import os
 from bpy.types import Operator
 from bpy.props import StringProperty, EnumProperty, BoolProperty
-import traceback
+import logging
 from ..utils import GLBExporter, ValidationHelper
-from ..utils.firebase_client import FirebaseClient, get_transform_data
+from ..scene_properties import append_upload_history
 from .. import config
 
+log = logging.getLogger(__name__)
+
+# Direct references for the redraw path; draw() runs many times per
+# second, so skip the class attribute lookups there
+_get_poly_count = GLBExporter.get_poly_count
+_estimate_file_size = GLBExporter.estimate_file_size
+
+
+def _invalidate_glb_cache(scene, depsgraph=None):
+    """Drop cached GLB exports when the scene actually changes.
+
+    Selection-only depsgraph updates carry neither geometry nor
+    transform flags and must not flush: the exporter's own
+    select/restore churn fires this handler right after every export,
+    which would delete the entry (and its file) before any rerun could
+    hit it. Called with depsgraph=None to flush unconditionally.
+    """
+    if depsgraph is not None:
+        for update in depsgraph.updates:
+            if update.is_updated_geometry or update.is_updated_transform:
+                break
+        else:
+            return
+
+    cache = bpy.app.driver_namespace.get('tippy_glb_cache')
+    if cache:
+        for path, _, _ in cache.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        cache.clear()
+
+
+def clear_glb_cache():
+    """Detach the invalidation handler and flush cached GLB files.
+
+    Called from the package unregister(); without it the handler from a
+    disabled addon keeps firing on every depsgraph update and the cached
+    exports leak in the temp dir.
+    """
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if _invalidate_glb_cache in handlers:
+        handlers.remove(_invalidate_glb_cache)
+    _invalidate_glb_cache(None)
+    bpy.app.driver_namespace.pop('tippy_glb_cache', None)
+
+
+def _get_glb_cache():
+    """Cache of exported GLBs keyed by (objects, preset, settings)"""
+    cache = bpy.app.driver_namespace.get('tippy_glb_cache')
+    if cache is None:
+        cache = {}
+        bpy.app.driver_namespace['tippy_glb_cache'] = cache
+        # Geometry/transform depsgraph updates flush the cache, so a
+        # hit means no exported data changed since the export
+        handlers = bpy.app.handlers.depsgraph_update_post
+        if _invalidate_glb_cache not in handlers:
+            handlers.append(_invalidate_glb_cache)
+    return cache
+
 class TIPPY_OT_export_upload(Operator):
     """Export selected objects as GLB and upload to Firebase"""
     bl_idname = "tippy.export_upload"
@@ -16,12 +78,7 @@ class TIPPY_OT_export_upload(Operator):
     export_preset: EnumProperty(
         name="Export Preset",
         description="Preset configuration for export",
-        items=[
-            ('mobile_vr', "Mobile VR", "Optimized for Quest and mobile devices"),
-            ('pc_vr', "PC VR", "Balanced quality for PC VR"),
-            ('high_quality', "High Quality", "Maximum quality for hero assets"),
-            ('custom', "Custom", "Use custom export settings"),
-        ],
+        items=config.PRESET_ITEMS_WITH_CUSTOM,
         default='mobile_vr'
     )
 
@@ -45,8 +102,13 @@ class TIPPY_OT_export_upload(Operator):
     
     def execute(self, context):
         try:
-            # Get selected objects
-            selected_objects = context.selected_objects.copy()
+            # Deferred import keeps the requests/HTTP stack off the addon
+            # registration path; sys.modules makes repeat calls cheap
+            from ..utils.firebase_client import FirebaseClient, get_transform_data
+
+            # Get selected objects; context.selected_objects already
+            # returns a fresh list, so no defensive copy is needed
+            selected_objects = context.selected_objects
             
             if not selected_objects:
                 self.report({'ERROR'}, "No objects selected")
@@ -74,27 +136,55 @@ class TIPPY_OT_export_upload(Operator):
                 prefs = context.preferences.addons["blender_banter_uploader"].preferences
                 settings = prefs.get_custom_export_settings()
             else:
-                settings = config.EXPORT_PRESETS[self.export_preset].copy()
+                # Frozen read-only preset; consumed without mutation
+                settings = config.EXPORT_PRESETS[self.export_preset]
             
-            # Export to GLB
-            self.report({'INFO'}, "Exporting to GLB...")
-            
-            try:
-                filepath, glb_data = GLBExporter.export_selection(
-                    selected_objects,
-                    settings=settings
-                )
-            except Exception as e:
-                self.report({'ERROR'}, f"Export failed: {str(e)}")
-                return {'CANCELLED'}
-            
-            # Check file size
-            size_mb = len(glb_data) / (1024 * 1024)
-            if size_mb > config.MAX_FILE_SIZE_MB:
-                self.report({'ERROR'}, f"File too large ({size_mb:.1f}MB), maximum is {config.MAX_FILE_SIZE_MB}MB")
-                return {'CANCELLED'}
-            
-            self.report({'INFO'}, f"Exported GLB ({size_mb:.2f}MB)")
+            # Re-running with unchanged geometry and settings (e.g. after
+            # fixing credentials) reuses the previous export
+            glb_cache = _get_glb_cache()
+            cache_key = (
+                tuple(sorted(o.as_pointer() for o in selected_objects)),
+                self.export_preset,
+                tuple(sorted(settings.items())),
+            )
+            filepath = None
+            entry = glb_cache.get(cache_key)
+            if entry:
+                cached_path, cached_size, cached_mtime = entry
+                try:
+                    if os.path.getmtime(cached_path) == cached_mtime:
+                        filepath = cached_path
+                        size_mb = cached_size
+                        self.report({'INFO'}, f"Reusing cached GLB ({size_mb:.2f}MB)")
+                except OSError:
+                    pass
+
+            if filepath is None:
+                # Export to GLB
+                self.report({'INFO'}, "Exporting to GLB...")
+
+                try:
+                    filepath, _ = GLBExporter.export_selection(
+                        selected_objects,
+                        settings=settings,
+                        return_bytes=False
+                    )
+                except Exception as e:
+                    self.report({'ERROR'}, f"Export failed: {str(e)}")
+                    return {'CANCELLED'}
+
+                # Check file size (from disk; the GLB is streamed, not buffered)
+                size_mb = os.path.getsize(filepath) / (1024 * 1024)
+                if size_mb > config.MAX_FILE_SIZE_MB:
+                    try:
+                        os.remove(filepath)
+                    except OSError:
+                        pass
+                    self.report({'ERROR'}, f"File too large ({size_mb:.1f}MB), maximum is {config.MAX_FILE_SIZE_MB}MB")
+                    return {'CANCELLED'}
+
+                glb_cache[cache_key] = (filepath, size_mb, os.path.getmtime(filepath))
+                self.report({'INFO'}, f"Exported GLB ({size_mb:.2f}MB)")
 
             # Get Firebase configuration from preferences
             prefs = context.preferences.addons["blender_banter_uploader"].preferences
@@ -137,11 +227,14 @@ class TIPPY_OT_export_upload(Operator):
             self.report({'INFO'}, f"Uploading '{mesh_name}' to Firebase...")
 
             try:
-                result = client.upload_with_retry(
-                    glb_data,
+                # Keep the file on disk so a follow-up run can reuse it;
+                # the depsgraph handler removes it on scene changes
+                result = client.upload_with_retry_file(
+                    filepath,
                     mesh_name=mesh_name,
                     transform=transform,
-                    max_retries=prefs.max_retries
+                    max_retries=prefs.max_retries,
+                    delete_after=False
                 )
             except Exception as e:
                 self.report({'ERROR'}, f"Firebase upload failed: {str(e)}")
@@ -156,16 +249,15 @@ class TIPPY_OT_export_upload(Operator):
             storage_url = result.get('storage_url', 'unknown')
             component_id = result.get('component_id', 'unknown')
             
-            # Store in scene for history using proper Blender properties
-            history_item = context.scene.tippy_upload_history.add()
-            history_item.hash = storage_url  # Store URL in hash field for compatibility
-            history_item.name = selected_objects[0].name if len(selected_objects) == 1 else f"{len(selected_objects)} objects"
-            history_item.size = size_mb
-            history_item.preset = self.export_preset
-
-            # Keep history limited to last 20 items
-            while len(context.scene.tippy_upload_history) > 20:
-                context.scene.tippy_upload_history.remove(0)
+            # Store in scene history (JSON-backed; one property write,
+            # trimming to the last 20 entries)
+            append_upload_history(context.scene, {
+                'hash': storage_url,  # Store URL in hash field for compatibility
+                'name': selected_objects[0].name if len(selected_objects) == 1 else f"{len(selected_objects)} objects",
+                'size_kb': int(size_mb * 1024),
+                'preset': self.export_preset,
+                'component_id': component_id,
+            })
 
             # Copy to clipboard if enabled
             if self.auto_copy_url:
@@ -181,7 +273,7 @@ class TIPPY_OT_export_upload(Operator):
 
         except Exception as e:
             self.report({'ERROR'}, f"Unexpected error: {str(e)}")
-            print(traceback.format_exc())
+            log.exception("Export & upload failed")
             return {'CANCELLED'}
 
     def invoke(self, context, event):
@@ -227,19 +319,19 @@ class TIPPY_OT_export_upload(Operator):
         if prefs.firebase_project_id:
             box.label(text=f"Project: {prefs.firebase_project_id}", icon='FILE_VOLUME')
         
-        # Selection info
+        # Selection info (read the RNA selection list once per redraw)
         layout.separator()
-        selected_count = len(context.selected_objects)
+        selected = context.selected_objects
+        selected_count = len(selected)
         if selected_count > 0:
             layout.separator()
             layout.label(text=f"Selected: {selected_count} object(s)")
             
             # Show poly count
-            from ..utils import GLBExporter
-            poly_count = GLBExporter.get_poly_count(context.selected_objects)
+            poly_count = _get_poly_count(selected)
             layout.label(text=f"Polygons: {poly_count:,}")
             
             # Estimate file size
-            estimated_size = GLBExporter.estimate_file_size(context.selected_objects)
+            estimated_size = _estimate_file_size(selected)
             size_mb = estimated_size / (1024 * 1024)
             layout.label(text=f"Estimated size: {size_mb:.2f}MB")
\ No newline at end of file
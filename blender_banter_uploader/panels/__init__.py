@@ -1,24 +1,31 @@
 import bpy
+from . import ui_panel
 from .ui_panel import (
     TIPPY_PT_upload_panel,
     TIPPY_PT_history_panel,
     TIPPY_PT_settings_panel,
+    TIPPY_OT_copy_url,
     TIPPY_OT_copy_hash,
+    TIPPY_OT_refresh_firebase_status,
     TIPPY_OT_refresh_server_status
 )
 
-classes = [
-    TIPPY_OT_copy_hash,  # Register operators first
+classes = (
+    TIPPY_OT_copy_url,  # Register operators first
+    TIPPY_OT_copy_hash,
+    TIPPY_OT_refresh_firebase_status,
     TIPPY_OT_refresh_server_status,
     TIPPY_PT_upload_panel,
     TIPPY_PT_history_panel,
     TIPPY_PT_settings_panel,
-]
+)
+
+# C-side loop over the tuple; no per-class Python dispatch at enable time
+register, _unregister_classes = bpy.utils.register_classes_factory(classes)
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
\ No newline at end of file
+    _unregister_classes()
+    # Drop the lazily-added depsgraph handler so the dead module's
+    # callback stops firing (and reloads don't stack duplicates)
+    ui_panel.remove_selection_handler()
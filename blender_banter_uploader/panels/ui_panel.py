@@ -1,9 +1,49 @@
 import bpy
 from bpy.types import Panel
+from collections import OrderedDict
 from ..utils import GLBExporter
-from ..utils.firebase_client import FirebaseClient
+from ..scene_properties import get_batch_results, get_upload_history
+import threading
 import time
 
+
+# Set by the depsgraph handler whenever anything in the scene changes
+# (selection changes included); lets draw() reuse the last stats tuple
+# without computing a signature key on clean redraws
+_selection_dirty = True
+
+
+def _mark_selection_dirty(scene, depsgraph=None):
+    """Flag the stats stale and drop the memoized entries.
+
+    The cache keys are object pointers, which survive mesh edits — a
+    geometry/modifier/material change would otherwise keep hitting the
+    stale entry, so the whole cache goes with the flag (mirroring
+    _invalidate_validation_cache in utils.validation).
+    """
+    global _selection_dirty
+    _selection_dirty = True
+    TIPPY_PT_upload_panel._selection_stats_cache.clear()
+    TIPPY_PT_upload_panel._last_selection_stats = None
+
+
+def remove_selection_handler():
+    """Detach the dirty-flag handler; called at unregister"""
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if _mark_selection_dirty in handlers:
+        handlers.remove(_mark_selection_dirty)
+
+
+def _tag_view3d_redraw():
+    """One-shot timer callback: repaint the 3D viewports"""
+    wm = bpy.context.window_manager
+    if wm:
+        for window in wm.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    return None
+
 class TIPPY_PT_upload_panel(Panel):
     """Main upload panel in 3D viewport sidebar"""
     bl_label = "Tippy Blender Link"
@@ -12,50 +52,186 @@ class TIPPY_PT_upload_panel(Panel):
     bl_region_type = 'UI'
     bl_category = "Tippy"
 
-    # Cache for Firebase status to avoid spamming
-    _firebase_status_cache = {}
-    _cache_duration = 10.0  # Check Firebase status at most once every 10 seconds
+    # Cache for Firebase status to avoid spamming; LRU-bounded so stale
+    # project/space keys from preference editing don't accumulate
+    _firebase_status_cache = OrderedDict()
+    _cache_max = 16
+    _cache_duration = 60.0  # Status badges tolerate a minute of staleness
+    # Keys with a background refresh already in flight
+    _refreshing = set()
+
+    # FirebaseClient (and its requests dependency) is only imported when
+    # a status check actually runs, keeping it off the register() path
+    _FirebaseClient = None
+
+    # Poly/size stats are O(total polys) to compute but draw() runs on
+    # every redraw; memoize per selection signature, LRU-bounded
+    _selection_stats_cache = OrderedDict()
+    _selection_stats_max = 8
+    # Stats tuple served while the depsgraph dirty flag stays clear
+    _last_selection_stats = None
+
+    # (prefs signature, config dict) memo so repeated status checks
+    # don't rebuild the same 7-entry dict from RNA reads
+    _firebase_config_cache = (None, None)
+
+    # One client per (config, space): keeps its requests.Session alive
+    # so repeat probes reuse the pooled TCP/TLS connection
+    _firebase_client_cache = (None, None)
+
+    @classmethod
+    def _get_firebase_client(cls, firebase_config, space_id):
+        """Reuse the cached FirebaseClient while the config is unchanged"""
+        if cls._FirebaseClient is None:
+            from ..utils.firebase_client import FirebaseClient
+            cls._FirebaseClient = FirebaseClient
+
+        key = (tuple(sorted(firebase_config.items())), space_id)
+        cached_key, client = cls._firebase_client_cache
+        if cached_key != key:
+            client = cls._FirebaseClient(firebase_config, space_id)
+            cls._firebase_client_cache = (key, client)
+        return client
+
+    @classmethod
+    def _get_firebase_config(cls, prefs):
+        """Build (or reuse) the Firebase config dict from preferences"""
+        signature = (
+            prefs.firebase_api_key,
+            prefs.firebase_auth_domain,
+            prefs.firebase_project_id,
+            prefs.firebase_storage_bucket,
+            prefs.firebase_messaging_sender_id,
+            prefs.firebase_app_id,
+            prefs.firebase_database_url,
+        )
+        cached_signature, config = cls._firebase_config_cache
+        if signature != cached_signature:
+            config = {
+                'apiKey': signature[0],
+                'authDomain': signature[1],
+                'projectId': signature[2],
+                'storageBucket': signature[3],
+                'messagingSenderId': signature[4],
+                'appId': signature[5],
+                'databaseURL': signature[6],
+            }
+            cls._firebase_config_cache = (signature, config)
+        return config
+
+    @classmethod
+    def _cache_status(cls, cache_key, result, timestamp):
+        """Store a status tuple, evicting the oldest key past the cap"""
+        cache = cls._firebase_status_cache
+        cache[cache_key] = (result, timestamp)
+        cache.move_to_end(cache_key)
+        if len(cache) > cls._cache_max:
+            cache.popitem(last=False)
 
     @classmethod
     def get_firebase_status(cls, prefs):
         """Get cached Firebase status or check if cache expired"""
-        current_time = time.time()
+        # monotonic() is cheaper than the gettimeofday-backed time() and
+        # immune to wall-clock jumps, which matters for TTL comparisons
+        # Unconfigured Firebase can't be connected; answer without
+        # touching the cache at all (common state for new users)
+        if not prefs.firebase_database_url or not prefs.firebase_api_key:
+            return False
+
+        current_time = time.monotonic()
         cache_key = f"{prefs.firebase_project_id}_{prefs.space_id}"
 
         # Check if we have a cached result
-        if cache_key in cls._firebase_status_cache:
-            cached_result, cached_time = cls._firebase_status_cache[cache_key]
+        cached = cls._firebase_status_cache.get(cache_key)
+        if cached is not None:
+            cls._firebase_status_cache.move_to_end(cache_key)
+            cached_result, cached_time = cached
 
             # Return cached result if still fresh (less than cache_duration seconds old)
             if current_time - cached_time < cls._cache_duration:
                 return cached_result
 
-        # Cache expired or doesn't exist, check Firebase status
-        try:
-            # Build Firebase config
-            firebase_config = {
-                'apiKey': prefs.firebase_api_key,
-                'authDomain': prefs.firebase_auth_domain,
-                'projectId': prefs.firebase_project_id,
-                'storageBucket': prefs.firebase_storage_bucket,
-                'messagingSenderId': prefs.firebase_messaging_sender_id,
-                'appId': prefs.firebase_app_id,
-                'databaseURL': prefs.firebase_database_url
-            }
+            # Stale-while-revalidate: serve the old value right away and
+            # refresh off the main thread so draw() never blocks on the
+            # network once a value exists
+            if cache_key not in cls._refreshing:
+                cls._start_background_refresh(cache_key, prefs)
+            return cached_result
 
-            # Check if Firebase is configured
-            if not prefs.firebase_database_url or not prefs.firebase_api_key:
-                cls._firebase_status_cache[cache_key] = (False, current_time)
-                return False
-
-            client = FirebaseClient(firebase_config, prefs.space_id)
-            is_connected, message = client.test_connection()
-            cls._firebase_status_cache[cache_key] = (is_connected, current_time)
-            return is_connected
-        except Exception:
-            # If check fails, cache the failure to avoid repeated attempts
-            cls._firebase_status_cache[cache_key] = (False, current_time)
-            return False
+        # Cold cache: seed a placeholder and probe asynchronously; even
+        # the first draw never runs a network call on the main thread.
+        # draw() renders None as "Checking..." until the result lands.
+        cls._cache_status(cache_key, None, current_time)
+        cls._start_background_refresh(cache_key, prefs)
+        return None
+
+    @classmethod
+    def _start_background_refresh(cls, cache_key, prefs):
+        """Probe Firebase on a worker thread and repaint when done"""
+        # Read the RNA preferences on the main thread; the worker only
+        # sees plain Python strings
+        firebase_config = cls._get_firebase_config(prefs)
+        space_id = prefs.space_id
+
+        if not firebase_config['databaseURL'] or not firebase_config['apiKey']:
+            cls._cache_status(cache_key, False, time.monotonic())
+            return
+
+        # Resolve the client on the main thread; the worker only probes
+        client = cls._get_firebase_client(firebase_config, space_id)
+
+        def _probe():
+            try:
+                is_connected, _ = client.test_connection()
+            except Exception:
+                is_connected = False
+            # dict writes are GIL-atomic, so no lock is needed here
+            cls._cache_status(cache_key, is_connected, time.monotonic())
+            cls._refreshing.discard(cache_key)
+            bpy.app.timers.register(_tag_view3d_redraw, first_interval=0.0)
+
+        cls._refreshing.add(cache_key)
+        threading.Thread(target=_probe, daemon=True).start()
+
+    @classmethod
+    def _get_selection_stats(cls, selected):
+        """Cached, pre-formatted selection labels for draw()
+
+        Returns (selection_label, poly_label, size_label, size_warning)
+        so a static selection costs no string formatting per redraw.
+        """
+        global _selection_dirty
+
+        handlers = bpy.app.handlers.depsgraph_update_post
+        if _mark_selection_dirty not in handlers:
+            handlers.append(_mark_selection_dirty)
+
+        # Nothing changed since the last redraw: skip even the
+        # signature hashing and return the previous tuple outright
+        if not _selection_dirty and cls._last_selection_stats is not None:
+            return cls._last_selection_stats
+
+        key = frozenset(obj.as_pointer() for obj in selected)
+        cache = cls._selection_stats_cache
+        stats = cache.get(key)
+        if stats is None:
+            poly_count = GLBExporter.get_poly_count(selected)
+            size_mb = GLBExporter.estimate_file_size(selected) / (1024 * 1024)
+            stats = (
+                f"Selected: {len(selected)} object(s)",
+                f"Polygons: {poly_count:,}",
+                f"Est. Size: {size_mb:.2f}MB",
+                size_mb > 20,
+            )
+            cache[key] = stats
+            if len(cache) > cls._selection_stats_max:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        cls._last_selection_stats = stats
+        _selection_dirty = False
+        return stats
 
     def draw(self, context):
         layout = self.layout
@@ -69,7 +245,9 @@ class TIPPY_PT_upload_panel(Panel):
 
         # Check Firebase status (using cached value)
         is_connected = self.get_firebase_status(prefs)
-        if is_connected:
+        if is_connected is None:
+            status_row.label(text="Checking...", icon='SORTTIME')
+        elif is_connected:
             status_row.label(text="Connected", icon='CHECKMARK')
         else:
             status_row.label(text="Not Connected", icon='ERROR')
@@ -77,31 +255,33 @@ class TIPPY_PT_upload_panel(Panel):
         # Add refresh button to force status check
         status_row.operator("tippy.refresh_firebase_status", text="", icon='FILE_REFRESH')
 
-        # Show project and space info
-        if prefs.firebase_project_id:
-            layout.label(text=f"Project: {prefs.firebase_project_id}", icon='FILE_VOLUME')
-        if prefs.space_id:
-            layout.label(text=f"Space: {prefs.space_id}", icon='GROUP')
+        # Show project and space info (each prefs read crosses the RNA
+        # boundary, so bind the reused strings to locals once)
+        project_id = prefs.firebase_project_id
+        space_id = prefs.space_id
+        if project_id:
+            layout.label(text=f"Project: {project_id}", icon='FILE_VOLUME')
+        if space_id:
+            layout.label(text=f"Space: {space_id}", icon='GROUP')
         
         layout.separator()
         
         # Selection info
-        selected_count = len(context.selected_objects)
+        selected = context.selected_objects
+        selected_count = len(selected)
         if selected_count == 0:
             layout.label(text="No objects selected", icon='INFO')
         else:
-            layout.label(text=f"Selected: {selected_count} object(s)", icon='OBJECT_DATA')
-            
-            # Show poly count and estimated size
-            poly_count = GLBExporter.get_poly_count(context.selected_objects)
-            layout.label(text=f"Polygons: {poly_count:,}")
-            
-            estimated_size = GLBExporter.estimate_file_size(context.selected_objects)
-            size_mb = estimated_size / (1024 * 1024)
+            # Labels are memoized per selection, so no per-redraw
+            # formatting (or mesh walking) for a static selection
+            selection_label, poly_label, size_label, size_warning = \
+                self._get_selection_stats(selected)
+            layout.label(text=selection_label, icon='OBJECT_DATA')
+            layout.label(text=poly_label)
             
             size_row = layout.row()
-            size_row.label(text=f"Est. Size: {size_mb:.2f}MB")
-            if size_mb > 20:
+            size_row.label(text=size_label)
+            if size_warning:
                 size_row.label(text="", icon='ERROR')
         
         layout.separator()
@@ -110,7 +290,7 @@ class TIPPY_PT_upload_panel(Panel):
         config_box = layout.box()
         config_row = config_box.row()
         config_row.label(text="Config:", icon='SETTINGS')
-        if prefs.space_id and prefs.firebase_project_id:
+        if space_id and project_id:
             config_row.label(text="Complete", icon='CHECKMARK')
         else:
             config_row.label(text="Incomplete", icon='INFO')
@@ -122,12 +302,13 @@ class TIPPY_PT_upload_panel(Panel):
         col = layout.column(align=True)
         
         # Main export button
+        default_preset = prefs.default_preset
         main_btn = col.operator(
             "tippy.export_upload",
             text="Export & Upload",
             icon='EXPORT'
         )
-        main_btn.export_preset = prefs.default_preset
+        main_btn.export_preset = default_preset
 
         # Batch export button
         if selected_count > 1:
@@ -136,7 +317,7 @@ class TIPPY_PT_upload_panel(Panel):
                 text=f"Batch Export ({selected_count} objects)",
                 icon='COPY_ID'
             )
-            batch_btn.export_preset = prefs.default_preset
+            batch_btn.export_preset = default_preset
 
         # Last upload info
         if scene.tippy_last_upload_hash:  # Now stores URL
@@ -167,47 +348,51 @@ class TIPPY_PT_history_panel(Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
     bl_options = {'DEFAULT_CLOSED'}
-    
+
     def draw(self, context):
         layout = self.layout
         scene = context.scene
-        
+
+        # JSON-backed history: one string read per property, parsed
+        # lists cached in scene_properties until the string changes
+        batch_results = get_batch_results(scene)
+        history = get_upload_history(scene)
+
+        # Empty state: one label, none of the box/row building below
+        if not batch_results and not history:
+            layout.label(text="No upload history", icon='INFO')
+            return
+
         # Check for batch results
-        if scene.tippy_batch_results:
+        if batch_results:
             layout.label(text="Recent Batch Upload:", icon='COPY_ID')
 
             box = layout.box()
-            # Show last 5 batch results
-            count = min(5, len(scene.tippy_batch_results))
-            for i in range(count):
-                item = scene.tippy_batch_results[-(i+1)]  # Show most recent first
+            # Show last 5 batch results, most recent first
+            for item in reversed(batch_results[-5:]):
                 row = box.row()
-                row.label(text=item.name)
-                row.label(text=f"{item.size:.1f}MB")
+                row.label(text=item['name'])
+                row.label(text=f"{item['size_kb'] / 1024:.1f}MB")
                 # Show shortened URL
-                url_display = item.hash  # Now contains URL
+                url_display = item['hash']  # Now contains URL
                 if len(url_display) > 20:
                     url_display = url_display[:17] + "..."
                 row.label(text=url_display)
 
         # Show upload history if available
-        if scene.tippy_upload_history:
-            if scene.tippy_batch_results:
+        if history:
+            if batch_results:
                 layout.separator()
 
             layout.label(text="Recent Uploads:", icon='TIME')
 
             box = layout.box()
-            # Show last 5 history items
-            count = min(5, len(scene.tippy_upload_history))
-            for i in range(count):
-                item = scene.tippy_upload_history[-(i+1)]  # Show most recent first
+            # Show last 5 history items, most recent first
+            for item in reversed(history[-5:]):
                 row = box.row()
-                row.label(text=item.name)
-                row.label(text=f"{item.size:.1f}MB")
-                row.label(text=item.preset)
-        else:
-            layout.label(text="No upload history", icon='INFO')
+                row.label(text=item['name'])
+                row.label(text=f"{item['size_kb'] / 1024:.1f}MB")
+                row.label(text=item['preset'])
 
 
 class TIPPY_PT_settings_panel(Panel):
@@ -230,15 +415,17 @@ class TIPPY_PT_settings_panel(Panel):
         layout.prop(prefs, "auto_copy_hash")  # Still using old property name for compatibility
 
         # Firebase info (read-only in panel, change in preferences)
-        if prefs.firebase_project_id:
+        project_id = prefs.firebase_project_id
+        space_id = prefs.space_id
+        if project_id:
             row = layout.row()
             row.label(text="Project:")
-            row.label(text=prefs.firebase_project_id)
+            row.label(text=project_id)
 
-        if prefs.space_id:
+        if space_id:
             row = layout.row()
             row.label(text="Space:")
-            row.label(text=prefs.space_id)
+            row.label(text=space_id)
 
         # Link to preferences
         layout.operator(
@@ -248,6 +435,43 @@ class TIPPY_PT_settings_panel(Panel):
         ).module = "blender_banter_uploader"
 
 
+# Shared implementations so the legacy operators don't pay a full
+# bpy.ops dispatch (context resolution, poll, undo push) just to
+# forward to the new ones
+
+def _do_copy_url(context, url):
+    """Copy a URL to the clipboard; returns False when there is none"""
+    if not url:
+        url = context.scene.tippy_last_upload_hash  # Now contains URL
+    if url:
+        context.window_manager.clipboard = url
+        return True
+    return False
+
+
+_last_refresh_monotonic = 0.0
+
+def _refresh_firebase_status(context):
+    """Clear the cached status and repaint; debounced to 4 Hz"""
+    global _last_refresh_monotonic
+    now = time.monotonic()
+    if now - _last_refresh_monotonic < 0.25:
+        return False
+    _last_refresh_monotonic = now
+
+    prefs = context.preferences.addons["blender_banter_uploader"].preferences
+    cache_key = f"{prefs.firebase_project_id}_{prefs.space_id}"
+
+    # Clear the cache for this Firebase config to force a fresh check
+    TIPPY_PT_upload_panel._firebase_status_cache.pop(cache_key, None)
+
+    # Force a redraw of the UI
+    for area in context.screen.areas:
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+    return True
+
+
 # Utility operator for copying URL (keeping old name for compatibility)
 class TIPPY_OT_copy_url(bpy.types.Operator):
     """Copy URL to clipboard"""
@@ -257,11 +481,7 @@ class TIPPY_OT_copy_url(bpy.types.Operator):
     url_value: bpy.props.StringProperty()
 
     def execute(self, context):
-        if self.url_value:
-            context.window_manager.clipboard = self.url_value
-            self.report({'INFO'}, "URL copied to clipboard")
-        elif context.scene.tippy_last_upload_hash:  # Now contains URL
-            context.window_manager.clipboard = context.scene.tippy_last_upload_hash
+        if _do_copy_url(context, self.url_value):
             self.report({'INFO'}, "URL copied to clipboard")
         else:
             self.report({'WARNING'}, "No URL to copy")
@@ -276,8 +496,10 @@ class TIPPY_OT_copy_hash(bpy.types.Operator):
     hash_value: bpy.props.StringProperty()
 
     def execute(self, context):
-        # Redirect to new operator
-        bpy.ops.tippy.copy_url(url_value=self.hash_value)
+        if _do_copy_url(context, self.hash_value):
+            self.report({'INFO'}, "URL copied to clipboard")
+        else:
+            self.report({'WARNING'}, "No URL to copy")
         return {'FINISHED'}
 
 
@@ -288,18 +510,8 @@ class TIPPY_OT_refresh_firebase_status(bpy.types.Operator):
     bl_label = "Refresh Firebase Status"
 
     def execute(self, context):
-        prefs = context.preferences.addons["blender_banter_uploader"].preferences
-        cache_key = f"{prefs.firebase_project_id}_{prefs.space_id}"
-
-        # Clear the cache for this Firebase config to force a fresh check
-        if cache_key in TIPPY_PT_upload_panel._firebase_status_cache:
-            del TIPPY_PT_upload_panel._firebase_status_cache[cache_key]
-
-        # Force a redraw of the UI
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
-
+        if not _refresh_firebase_status(context):
+            return {'CANCELLED'}
         self.report({'INFO'}, "Firebase status refreshed")
         return {'FINISHED'}
 
@@ -310,6 +522,7 @@ class TIPPY_OT_refresh_server_status(bpy.types.Operator):
     bl_label = "Refresh Status"
 
     def execute(self, context):
-        # Redirect to new operator
-        bpy.ops.tippy.refresh_firebase_status()
+        if not _refresh_firebase_status(context):
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Firebase status refreshed")
         return {'FINISHED'}
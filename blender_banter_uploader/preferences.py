@@ -1,11 +1,16 @@
 import bpy
 from bpy.types import AddonPreferences
 from bpy.props import StringProperty, EnumProperty, BoolProperty, IntProperty, FloatProperty
-import traceback
 
-# Debug function
-def debug_print(msg):
-    print(f"[TIPPY PREFS DEBUG] {msg}")
+from . import DEBUG
+
+if DEBUG:
+    def debug_print(msg):
+        print(f"[TIPPY PREFS DEBUG] {msg}")
+else:
+    def debug_print(msg):
+        """No-op when debug mode is disabled"""
+        pass
 
 debug_print("Preferences module loading...")
 
@@ -14,57 +19,110 @@ try:
     debug_print(f"Config imported successfully")
     DEFAULT_EXPORT_PRESET = config.DEFAULT_EXPORT_PRESET
     MAX_FILE_SIZE_MB = config.MAX_FILE_SIZE_MB
+    PRESET_ITEMS_WITH_CUSTOM = config.PRESET_ITEMS_WITH_CUSTOM
 except Exception as e:
     debug_print(f"ERROR importing config: {e}")
-    debug_print(traceback.format_exc())
+    if DEBUG:
+        import traceback
+        debug_print(traceback.format_exc())
     # Fallback values
     DEFAULT_EXPORT_PRESET = "mobile_vr"
     MAX_FILE_SIZE_MB = 20
+    PRESET_ITEMS_WITH_CUSTOM = (
+        ('mobile_vr', "Mobile VR", "Optimized for Quest and mobile devices"),
+        ('pc_vr', "PC VR", "Balanced quality for PC VR"),
+        ('high_quality', "High Quality", "Maximum quality for hero assets"),
+        ('custom', "Custom", "Use custom export settings"),
+    )
+
+# Memoized addon preferences: the addons[...] chain walks RNA on every
+# call, while the wrapper stays valid for the whole session. Cleared on
+# unregister so addon reloads resolve a fresh one.
+_prefs_cache = None
+
+def get_prefs(context=None):
+    """Return the addon preferences, resolving the lookup once"""
+    global _prefs_cache
+    if _prefs_cache is None:
+        ctx = context if context is not None else bpy.context
+        _prefs_cache = ctx.preferences.addons["blender_banter_uploader"].preferences
+    return _prefs_cache
+
+# Constant portion of the custom export settings; get_custom_export_settings
+# overlays only the six user-controlled values per call instead of
+# rebuilding the full 16-key literal
+_EXPORT_CONST = {
+    'export_format': 'GLB',
+    'export_image_format': 'AUTO',
+    'export_texture_dir': '',
+    'export_texcoords': True,
+    'export_normals': True,
+    'export_materials': 'EXPORT',
+    'export_colors': True,
+    'export_cameras': False,
+    'export_lights': False,
+    'export_frame_range': False,
+}
+
+def _invalidate_firebase_cache(self, context):
+    """update= callback: a Firebase field changed, drop the cached dict"""
+    TippyUploaderPreferences._firebase_cfg_cache = None
 
 class TippyUploaderPreferences(AddonPreferences):
     bl_idname = "blender_banter_uploader"
 
+    # Firebase config dict built from the seven fields below; rebuilt
+    # only when one of them changes instead of seven RNA reads per use
+    _firebase_cfg_cache = None
+
     # Firebase configuration settings
     firebase_api_key: StringProperty(
         name="API Key",
         description="Firebase API Key",
-        default=""
+        default="",
+        update=_invalidate_firebase_cache
     )
 
     firebase_auth_domain: StringProperty(
         name="Auth Domain",
         description="Firebase Auth Domain (e.g., your-project.firebaseapp.com)",
-        default=""
+        default="",
+        update=_invalidate_firebase_cache
     )
 
     firebase_project_id: StringProperty(
         name="Project ID",
         description="Firebase Project ID",
-        default=""
+        default="",
+        update=_invalidate_firebase_cache
     )
 
     firebase_storage_bucket: StringProperty(
         name="Storage Bucket",
         description="Firebase Storage Bucket (e.g., your-project.appspot.com)",
-        default=""
+        default="",
+        update=_invalidate_firebase_cache
     )
 
     firebase_messaging_sender_id: StringProperty(
         name="Messaging Sender ID",
         description="Firebase Messaging Sender ID",
-        default=""
+        default="",
+        update=_invalidate_firebase_cache
     )
 
     firebase_app_id: StringProperty(
         name="App ID",
         description="Firebase App ID",
-        default=""
+        default="",
+        update=_invalidate_firebase_cache
     )
 
     firebase_database_url: StringProperty(
         name="Database URL",
         description="Firebase Realtime Database URL",
-        default=""
+        default="",
+        update=_invalidate_firebase_cache
     )
 
     # Space settings
@@ -78,15 +136,24 @@ class TippyUploaderPreferences(AddonPreferences):
     default_preset: EnumProperty(
         name="Default Export Preset",
         description="Default preset for exports",
-        items=[
-            ('mobile_vr', "Mobile VR", "Optimized for Quest and mobile devices"),
-            ('pc_vr', "PC VR", "Balanced quality for PC VR"),
-            ('high_quality', "High Quality", "Maximum quality for hero assets"),
-            ('custom', "Custom", "Use custom settings below"),
-        ],
+        items=PRESET_ITEMS_WITH_CUSTOM,
         default=DEFAULT_EXPORT_PRESET
     )
     
+    # Section toggles: a collapsed section skips its layout.prop calls
+    # (and the RNA reads behind them) on every preferences redraw
+    show_firebase: BoolProperty(
+        name="Firebase Configuration",
+        description="Show Firebase configuration fields",
+        default=True
+    )
+
+    show_advanced: BoolProperty(
+        name="Advanced Settings",
+        description="Show advanced upload settings",
+        default=False
+    )
+
     # UI settings
     auto_copy_hash: BoolProperty(
         name="Auto Copy Hash",
@@ -163,26 +230,32 @@ class TippyUploaderPreferences(AddonPreferences):
     def draw(self, context):
         layout = self.layout
 
-        # Firebase configuration
+        # Firebase configuration (collapsible)
         box = layout.box()
-        box.label(text="Firebase Configuration", icon='URL')
-        col = box.column(align=True)
-        col.prop(self, "firebase_api_key")
-        col.prop(self, "firebase_auth_domain")
-        col.prop(self, "firebase_project_id")
-        col.prop(self, "firebase_storage_bucket")
-        col.prop(self, "firebase_messaging_sender_id")
-        col.prop(self, "firebase_app_id")
-        col.prop(self, "firebase_database_url")
-
-        # Space settings
-        box.separator()
-        box.label(text="Space Settings", icon='LOCKED')
-        box.prop(self, "space_id")
-
-        # Test connection button
         row = box.row()
-        row.operator("tippy.test_firebase_connection", icon='FILE_REFRESH')
+        row.prop(
+            self, "show_firebase",
+            icon='TRIA_DOWN' if self.show_firebase else 'TRIA_RIGHT',
+            emboss=False
+        )
+        if self.show_firebase:
+            col = box.column(align=True)
+            col.prop(self, "firebase_api_key")
+            col.prop(self, "firebase_auth_domain")
+            col.prop(self, "firebase_project_id")
+            col.prop(self, "firebase_storage_bucket")
+            col.prop(self, "firebase_messaging_sender_id")
+            col.prop(self, "firebase_app_id")
+            col.prop(self, "firebase_database_url")
+
+            # Space settings
+            box.separator()
+            box.label(text="Space Settings", icon='LOCKED')
+            box.prop(self, "space_id")
+
+            # Test connection button
+            row = box.row()
+            row.operator("tippy.test_firebase_connection", icon='FILE_REFRESH')
         
         # Export settings
         box = layout.box()
@@ -207,38 +280,45 @@ class TippyUploaderPreferences(AddonPreferences):
         box.prop(self, "auto_copy_hash")
         box.prop(self, "show_validation_warnings")
         
-        # Advanced settings
+        # Advanced settings (collapsible, collapsed by default)
         box = layout.box()
-        box.label(text="Advanced Settings", icon='SETTINGS')
-        box.prop(self, "max_retries")
-        box.prop(self, "timeout_seconds")
+        row = box.row()
+        row.prop(
+            self, "show_advanced",
+            icon='TRIA_DOWN' if self.show_advanced else 'TRIA_RIGHT',
+            emboss=False
+        )
+        if self.show_advanced:
+            box.prop(self, "max_retries")
+            box.prop(self, "timeout_seconds")
     
+    def get_firebase_config(self):
+        """Firebase config dict, rebuilt only after a field changed"""
+        cfg = TippyUploaderPreferences._firebase_cfg_cache
+        if cfg is None:
+            cfg = {
+                'apiKey': self.firebase_api_key,
+                'authDomain': self.firebase_auth_domain,
+                'projectId': self.firebase_project_id,
+                'storageBucket': self.firebase_storage_bucket,
+                'messagingSenderId': self.firebase_messaging_sender_id,
+                'appId': self.firebase_app_id,
+                'databaseURL': self.firebase_database_url
+            }
+            TippyUploaderPreferences._firebase_cfg_cache = cfg
+        return cfg
+
     def get_custom_export_settings(self):
         """Get custom export settings as dictionary"""
-        try:
-            from . import config
-            base_settings = config.EXPORT_PRESETS.get('mobile_vr', {}).copy()
-        except:
-            base_settings = {}
-        
-        return {
-            'export_format': 'GLB',
-            'export_image_format': 'AUTO',
-            'export_texture_dir': '',
-            'export_texcoords': True,
-            'export_normals': True,
-            'export_materials': 'EXPORT',
-            'export_colors': True,
-            'export_cameras': False,
-            'export_lights': False,
-            'export_animations': self.custom_export_animations,
-            'export_frame_range': False,
-            'export_apply': self.custom_apply_modifiers,
-            'export_draco_mesh_compression_enable': self.custom_compression,
-            'export_draco_mesh_compression_level': self.custom_compression_level,
-            'export_image_quality': self.custom_image_quality,
-            'export_texture_size_limit': self.custom_texture_limit,
-        }
+        return dict(
+            _EXPORT_CONST,
+            export_animations=self.custom_export_animations,
+            export_apply=self.custom_apply_modifiers,
+            export_draco_mesh_compression_enable=self.custom_compression,
+            export_draco_mesh_compression_level=self.custom_compression_level,
+            export_image_quality=self.custom_image_quality,
+            export_texture_size_limit=self.custom_texture_limit,
+        )
 
 
 class TIPPY_OT_test_firebase_connection(bpy.types.Operator):
@@ -248,22 +328,14 @@ class TIPPY_OT_test_firebase_connection(bpy.types.Operator):
 
     def execute(self, context):
         try:
-            prefs = context.preferences.addons["blender_banter_uploader"].preferences
+            prefs = get_prefs(context)
             from .utils.firebase_client import FirebaseClient
 
-            # Build Firebase config
-            firebase_config = {
-                'apiKey': prefs.firebase_api_key,
-                'authDomain': prefs.firebase_auth_domain,
-                'projectId': prefs.firebase_project_id,
-                'storageBucket': prefs.firebase_storage_bucket,
-                'messagingSenderId': prefs.firebase_messaging_sender_id,
-                'appId': prefs.firebase_app_id,
-                'databaseURL': prefs.firebase_database_url
-            }
+            # Cached config: rebuilt only when a field changed
+            firebase_config = prefs.get_firebase_config()
 
             # Check if configuration is provided
-            if not prefs.firebase_database_url or not prefs.firebase_api_key:
+            if not firebase_config['databaseURL'] or not firebase_config['apiKey']:
                 self.report({'ERROR'}, "Firebase configuration incomplete. Please fill in all fields.")
                 return {'CANCELLED'}
 
@@ -282,39 +354,37 @@ class TIPPY_OT_test_firebase_connection(bpy.types.Operator):
         except Exception as e:
             self.report({'ERROR'}, f"Error testing Firebase connection: {str(e)}")
             debug_print(f"Firebase connection test error: {e}")
-            debug_print(traceback.format_exc())
+            if DEBUG:
+                import traceback
+                debug_print(traceback.format_exc())
 
         return {'FINISHED'}
 
 
+# Classes already registered this session; F3/script reloads call
+# register() again and re-registering raises (and re-walks RNA) before
+# recovering on the exception path
+_REGISTERED = set()
+
+def _safe_register(cls):
+    if cls not in _REGISTERED:
+        bpy.utils.register_class(cls)
+        _REGISTERED.add(cls)
+
+def _safe_unregister(cls):
+    if cls in _REGISTERED:
+        bpy.utils.unregister_class(cls)
+        _REGISTERED.discard(cls)
+
 def register():
     debug_print("Registering preferences classes...")
-    try:
-        bpy.utils.register_class(TippyUploaderPreferences)
-        debug_print("  ✓ TippyUploaderPreferences registered")
-    except Exception as e:
-        debug_print(f"  ERROR registering TippyUploaderPreferences: {e}")
-        debug_print(f"  Error type: {type(e).__name__}")
-        debug_print(traceback.format_exc())
-        raise
-
-    try:
-        bpy.utils.register_class(TIPPY_OT_test_firebase_connection)
-        debug_print("  ✓ TIPPY_OT_test_firebase_connection registered")
-    except Exception as e:
-        debug_print(f"  ERROR registering TIPPY_OT_test_firebase_connection: {e}")
-        raise
+    _safe_register(TippyUploaderPreferences)
+    _safe_register(TIPPY_OT_test_firebase_connection)
+    debug_print("  ✓ Preferences classes registered")
 
 def unregister():
+    global _prefs_cache
+    _prefs_cache = None
     debug_print("Unregistering preferences classes...")
-    try:
-        bpy.utils.unregister_class(TIPPY_OT_test_firebase_connection)
-        debug_print("  ✓ TIPPY_OT_test_firebase_connection unregistered")
-    except Exception as e:
-        debug_print(f"  ERROR unregistering TIPPY_OT_test_firebase_connection: {e}")
-
-    try:
-        bpy.utils.unregister_class(TippyUploaderPreferences)
-        debug_print("  ✓ TippyUploaderPreferences unregistered")
-    except Exception as e:
-        debug_print(f"  ERROR unregistering TippyUploaderPreferences: {e}")
\ No newline at end of file
+    _safe_unregister(TIPPY_OT_test_firebase_connection)
+    _safe_unregister(TippyUploaderPreferences)
\ No newline at end of file
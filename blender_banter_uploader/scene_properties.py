@@ -3,69 +3,65 @@ Scene properties for storing upload history and state
 """
 
 import bpy
-from bpy.props import StringProperty, CollectionProperty, FloatProperty
-from bpy.types import PropertyGroup
-
-class UploadHistoryItem(PropertyGroup):
-    """Single upload history entry"""
-    hash: StringProperty(
-        name="URL",
-        description="Firebase Storage URL (stored in hash field for compatibility)"
-    )
-    name: StringProperty(
-        name="Name",
-        description="Object or collection name"
-    )
-    size: FloatProperty(
-        name="Size",
-        description="File size in MB"
-    )
-    preset: StringProperty(
-        name="Preset",
-        description="Export preset used"
-    )
-    component_id: StringProperty(
-        name="Component ID",
-        description="Firebase component ID",
-        default=""
-    )
+import json
+from bpy.props import StringProperty
+
+# History lives in JSON StringProperties rather than CollectionProperty
+# arrays: large RNA collections are rescanned per redraw and are a known
+# UI-freeze trigger, while an opaque string costs one read. The parsed
+# lists are cached per (scene, property) and invalidated by comparing
+# the raw string, so draw() never re-parses unchanged history.
+_parse_cache = {}
+
+
+def _get_items(scene, prop_name):
+    raw = getattr(scene, prop_name)
+    key = (scene.as_pointer(), prop_name)
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    try:
+        items = json.loads(raw)
+    except ValueError:
+        items = []
+    _parse_cache[key] = (raw, items)
+    return items
+
+
+def get_upload_history(scene):
+    """Upload history as a list of dicts (name, hash, size_kb, preset, component_id)"""
+    return _get_items(scene, 'tippy_upload_history')
+
+
+def get_batch_results(scene):
+    """Last batch results as a list of dicts (name, hash, size_kb, component_id)"""
+    return _get_items(scene, 'tippy_batch_results')
+
+
+def append_upload_history(scene, item, limit=20):
+    """Append one history entry, keeping only the most recent `limit`"""
+    items = list(get_upload_history(scene))
+    items.append(item)
+    scene.tippy_upload_history = json.dumps(items[-limit:])
+
+
+def set_batch_results(scene, items):
+    """Replace the batch results in one property write"""
+    scene.tippy_batch_results = json.dumps(items)
 
-class BatchResultItem(PropertyGroup):
-    """Batch upload result entry"""
-    name: StringProperty(
-        name="Name",
-        description="Object name"
-    )
-    hash: StringProperty(
-        name="URL",
-        description="Firebase Storage URL (stored in hash field for compatibility)"
-    )
-    size: FloatProperty(
-        name="Size",
-        description="File size in MB"
-    )
-    component_id: StringProperty(
-        name="Component ID",
-        description="Firebase component ID",
-        default=""
-    )
 
 def register():
     """Register scene properties"""
-    bpy.utils.register_class(UploadHistoryItem)
-    bpy.utils.register_class(BatchResultItem)
-    
-    # Add properties to Scene type
-    bpy.types.Scene.tippy_upload_history = CollectionProperty(
-        type=UploadHistoryItem,
+    bpy.types.Scene.tippy_upload_history = StringProperty(
         name="Upload History",
-        description="History of uploaded assets"
+        description="History of uploaded assets (JSON)",
+        default='[]'
     )
 
-    bpy.types.Scene.tippy_batch_results = CollectionProperty(
-        type=BatchResultItem,
+    bpy.types.Scene.tippy_batch_results = StringProperty(
         name="Batch Results",
-        description="Results from last batch upload"
+        description="Results from last batch upload (JSON)",
+        default='[]'
     )
 
     bpy.types.Scene.tippy_last_upload_hash = StringProperty(
@@ -74,8 +70,11 @@ def register():
         default=""
     )
 
+
 def unregister():
     """Unregister scene properties"""
+    _parse_cache.clear()
+
     # Remove properties from Scene type
     if hasattr(bpy.types.Scene, 'tippy_last_upload_hash'):
         del bpy.types.Scene.tippy_last_upload_hash
@@ -83,7 +82,3 @@ def unregister():
         del bpy.types.Scene.tippy_batch_results
     if hasattr(bpy.types.Scene, 'tippy_upload_history'):
         del bpy.types.Scene.tippy_upload_history
-
-    # Unregister classes
-    bpy.utils.unregister_class(BatchResultItem)
-    bpy.utils.unregister_class(UploadHistoryItem)
\ No newline at end of file
@@ -1,17 +1,34 @@
-from .glb_exporter import GLBExporter
-from .firebase_client import FirebaseClient, get_transform_data, generate_component_id
-from .validation import ValidationHelper
-from .blender_compat import get_gltf_export_params, print_available_gltf_params
+import importlib
 
-# Keep TippyUploader import for backward compatibility if needed
-try:
-    from .http_client import TippyUploader
-except ImportError:
-    # http_client.py might be removed in future
-    TippyUploader = None
+# Lazily resolved exports (PEP 562): importing the package no longer
+# pulls requests and the gltf machinery in at addon load; each symbol
+# is imported on first access and cached in globals() afterwards
+_LAZY = {
+    'GLBExporter': '.glb_exporter',
+    'FirebaseClient': '.firebase_client',
+    'get_transform_data': '.firebase_client',
+    'generate_component_id': '.firebase_client',
+    'ValidationHelper': '.validation',
+    'get_gltf_export_params': '.blender_compat',
+    'print_available_gltf_params': '.blender_compat',
+    # Kept for backward compatibility; resolves to None if the module
+    # is removed in future
+    'TippyUploader': '.http_client',
+}
 
-__all__ = ['GLBExporter', 'FirebaseClient', 'ValidationHelper', 'get_gltf_export_params', 'print_available_gltf_params', 'get_transform_data', 'generate_component_id']
+__all__ = ['GLBExporter', 'FirebaseClient', 'ValidationHelper', 'get_gltf_export_params', 'print_available_gltf_params', 'get_transform_data', 'generate_component_id', 'TippyUploader']
 
-# Add TippyUploader to exports only if it exists
-if TippyUploader:
-    __all__.append('TippyUploader')
\ No newline at end of file
+
+def __getattr__(name):
+    target = _LAZY.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(target, __name__)
+        value = getattr(module, name)
+    except ImportError:
+        if name != 'TippyUploader':
+            raise
+        value = None
+    globals()[name] = value
+    return value
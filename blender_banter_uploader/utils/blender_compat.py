@@ -4,6 +4,86 @@ Handles differences in GLTF exporter parameters across Blender versions
 """
 
 import bpy
+import logging
+from functools import lru_cache
+from types import MappingProxyType
+
+log = logging.getLogger(__name__)
+
+# The Blender version (and therefore the parameter set the gltf exporter
+# accepts) cannot change within a session, so resolve the branch once at
+# import instead of re-reading bpy.app.version per export
+_BLENDER_VERSION = bpy.app.version
+if _BLENDER_VERSION >= (4, 0, 0):
+    _BRANCH = '4.0'
+elif _BLENDER_VERSION >= (3, 3, 0):
+    _BRANCH = '3.3'
+else:
+    _BRANCH = '3.0'
+
+# The vertex-color parameter was renamed in some 4.x builds; the hasattr
+# probe walks an operator try/except path, so do it exactly once
+if _BRANCH == '4.0' and not hasattr(bpy.ops.export_scene.gltf, 'export_colors'):
+    _COLOR_KEY = 'export_vertex_colors'
+else:
+    _COLOR_KEY = 'export_colors'
+
+# Constant portions of the parameter sets, built once per branch; the
+# per-call work is one dict copy plus the settings-derived overlay
+_COMMON_BASE = {
+    'use_selection': True,
+    'use_visible': False,
+    'use_renderable': False,
+    'export_frame_step': 1,
+    'export_force_sampling': False,
+    'export_def_bones': False,
+    'export_current_frame': False,
+    'export_skins': True,
+    'export_all_influences': False,
+    'export_morph': True,
+    'export_morph_normal': True,
+    'export_morph_tangent': False,
+}
+
+# 3.3 and 4.0 share the full modern parameter set; they differ only in
+# the vertex-color key resolved above
+_MODERN_BASE = _COMMON_BASE | {
+    'export_attributes': False,
+    'use_mesh_edges': False,
+    'use_mesh_vertices': False,
+    'export_animation_mode': 'ACTIONS',
+    'export_nla_strips_merged_animation_name': 'Animation',
+    'optimize_animation_size': True,
+    'export_anim_slide_to_zero': False,
+    'export_bake_animation': False,
+    'export_anim_single_armature': True,
+    'export_reset_pose_bones': True,
+    'export_rest_position_armature': True,
+    'export_anim_scene_split_object': True,
+    'export_hierarchy_flatten_bones': False,
+    'export_optimize_animation_keep_anim_armature': True,
+    'export_optimize_animation_keep_anim_object': False,
+    'export_negative_frame': 'CLIP',
+    'export_influence_nb': 4,
+    'export_morph_animation': True,
+    'export_morph_reset_sk_data': True,
+    'export_shared_accessors': False,
+    'export_try_sparse_sk': True,
+    'export_try_omit_sparse_sk': False,
+    'export_gpu_instances': False,
+    'export_action_filter': False,
+    'export_convert_animation_pointer': False,
+    'export_user_extensions': False,
+}
+
+# Frozen like config.EXPORT_PRESETS: any accidental write raises
+# instead of silently poisoning every later export
+_BASE_PARAMS = {
+    '4.0': MappingProxyType(_MODERN_BASE),
+    '3.3': MappingProxyType(_MODERN_BASE),
+    # Blender 3.0 - 3.2 (more limited)
+    '3.0': MappingProxyType(_COMMON_BASE | {'export_nla_strips': False}),
+}
 
 def get_gltf_export_params(settings, filepath):
     """
@@ -16,165 +96,43 @@ def get_gltf_export_params(settings, filepath):
     Returns:
         dict: Parameters compatible with current Blender version
     """
-    blender_version = bpy.app.version
-    
-    # Base parameters that work across versions
-    params = {
-        'filepath': filepath,
+    # The handful of preset/custom settings dicts in play repeat across
+    # exports, so the full resolution is memoized on their items; only
+    # the filepath differs per call
+    params = dict(_resolve_params(frozenset(settings.items())))
+    params['filepath'] = filepath
+    return params
+
+
+@lru_cache(maxsize=8)
+def _resolve_params(settings_key):
+    """Resolve one settings signature to its exporter parameter dict"""
+    settings = dict(settings_key)
+    # One C-level merge of the frozen base and the settings overlay
+    params = _BASE_PARAMS[_BRANCH] | {
         'export_format': settings.get('export_format', 'GLB'),
+        'export_apply': settings.get('export_apply', True),
+        'export_texcoords': settings.get('export_texcoords', True),
+        'export_normals': settings.get('export_normals', True),
+        'export_materials': settings.get('export_materials', 'EXPORT'),
+        'export_cameras': settings.get('export_cameras', False),
+        'export_lights': settings.get('export_lights', False),
+        'export_animations': settings.get('export_animations', True),
+        'export_frame_range': settings.get('export_frame_range', False),
+        _COLOR_KEY: settings.get('export_colors', True),
     }
     
-    # Version-specific parameter mapping
-    if blender_version >= (4, 0, 0):
-        # Blender 4.0+ parameters
-        params.update({
-            'use_selection': True,
-            'use_visible': False,
-            'use_renderable': False,
-            'export_apply': settings.get('export_apply', True),
-            'export_texcoords': settings.get('export_texcoords', True),
-            'export_normals': settings.get('export_normals', True),
-            'export_materials': settings.get('export_materials', 'EXPORT'),
-            'use_mesh_edges': False,
-            'use_mesh_vertices': False,
-            'export_cameras': settings.get('export_cameras', False),
-            'export_lights': settings.get('export_lights', False),
-            'export_animations': settings.get('export_animations', True),
-            'export_frame_range': settings.get('export_frame_range', False),
-            'export_frame_step': 1,
-            'export_force_sampling': False,
-            'export_animation_mode': 'ACTIONS',
-            'export_nla_strips_merged_animation_name': 'Animation',
-            'optimize_animation_size': True,
-            'export_anim_slide_to_zero': False,
-            'export_bake_animation': False,
-            'export_anim_single_armature': True,
-            'export_reset_pose_bones': True,
-            'export_current_frame': False,
-            'export_rest_position_armature': True,
-            'export_anim_scene_split_object': True,
-            'export_def_bones': False,
-            'export_hierarchy_flatten_bones': False,
-            'export_optimize_animation_keep_anim_armature': True,
-            'export_optimize_animation_keep_anim_object': False,
-            'export_negative_frame': 'CLIP',
-            'export_skins': True,
-            'export_influence_nb': 4,
-            'export_all_influences': False,
-            'export_morph': True,
-            'export_morph_normal': True,
-            'export_morph_tangent': False,
-            'export_morph_animation': True,
-            'export_morph_reset_sk_data': True,
-            'export_attributes': False,
-            'use_mesh_edges': False,
-            'use_mesh_vertices': False,
-            'export_shared_accessors': False,
-            'export_try_sparse_sk': True,
-            'export_try_omit_sparse_sk': False,
-            'export_gpu_instances': False,
-            'export_action_filter': False,
-            'export_convert_animation_pointer': False,
-            'export_user_extensions': False,
-        })
-        
-        # Add vertex colors parameter (different in 4.0+)
-        if hasattr(bpy.ops.export_scene.gltf, 'export_colors'):
-            params['export_colors'] = settings.get('export_colors', True)
-        else:
-            params['export_vertex_colors'] = settings.get('export_colors', True)
-            
-    elif blender_version >= (3, 3, 0):
-        # Blender 3.3+ parameters
-        params.update({
-            'use_selection': True,
-            'use_visible': False,
-            'use_renderable': False,
-            'export_apply': settings.get('export_apply', True),
-            'export_texcoords': settings.get('export_texcoords', True),
-            'export_normals': settings.get('export_normals', True),
-            'export_materials': settings.get('export_materials', 'EXPORT'),
-            'export_colors': settings.get('export_colors', True),
-            'export_attributes': False,
-            'use_mesh_edges': False,
-            'use_mesh_vertices': False,
-            'export_cameras': settings.get('export_cameras', False),
-            'export_lights': settings.get('export_lights', False),
-            'export_animations': settings.get('export_animations', True),
-            'export_frame_range': settings.get('export_frame_range', False),
-            'export_frame_step': 1,
-            'export_force_sampling': False,
-            'export_animation_mode': 'ACTIONS',
-            'export_nla_strips_merged_animation_name': 'Animation',
-            'optimize_animation_size': True,
-            'export_anim_slide_to_zero': False,
-            'export_bake_animation': False,
-            'export_anim_single_armature': True,
-            'export_reset_pose_bones': True,
-            'export_current_frame': False,
-            'export_rest_position_armature': True,
-            'export_anim_scene_split_object': True,
-            'export_def_bones': False,
-            'export_hierarchy_flatten_bones': False,
-            'export_optimize_animation_keep_anim_armature': True,
-            'export_optimize_animation_keep_anim_object': False,
-            'export_negative_frame': 'CLIP',
-            'export_skins': True,
-            'export_influence_nb': 4,
-            'export_all_influences': False,
-            'export_morph': True,
-            'export_morph_normal': True,
-            'export_morph_tangent': False,
-            'export_morph_animation': True,
-            'export_morph_reset_sk_data': True,
-            'export_shared_accessors': False,
-            'export_try_sparse_sk': True,
-            'export_try_omit_sparse_sk': False,
-            'export_gpu_instances': False,
-            'export_action_filter': False,
-            'export_convert_animation_pointer': False,
-            'export_user_extensions': False,
-        })
-        
-    else:
-        # Blender 3.0 - 3.2 parameters (more limited)
-        params.update({
-            'use_selection': True,
-            'use_visible': False,
-            'use_renderable': False,
-            'export_apply': settings.get('export_apply', True),
-            'export_texcoords': settings.get('export_texcoords', True),
-            'export_normals': settings.get('export_normals', True),
-            'export_materials': settings.get('export_materials', 'EXPORT'),
-            'export_colors': settings.get('export_colors', True),
-            'export_cameras': settings.get('export_cameras', False),
-            'export_lights': settings.get('export_lights', False),
-            'export_animations': settings.get('export_animations', True),
-            'export_frame_range': settings.get('export_frame_range', False),
-            'export_frame_step': 1,
-            'export_force_sampling': False,
-            'export_nla_strips': False,
-            'export_def_bones': False,
-            'export_current_frame': False,
-            'export_skins': True,
-            'export_all_influences': False,
-            'export_morph': True,
-            'export_morph_normal': True,
-            'export_morph_tangent': False,
-        })
-    
     # Add Draco compression if supported and enabled
     if settings.get('export_draco_mesh_compression_enable', False):
-        if blender_version >= (3, 0, 0):
-            params['export_draco_mesh_compression_enable'] = True
-            params['export_draco_mesh_compression_level'] = settings.get(
-                'export_draco_mesh_compression_level', 6
-            )
-            params['export_draco_position_quantization'] = 14
-            params['export_draco_normal_quantization'] = 10
-            params['export_draco_texcoord_quantization'] = 12
-            params['export_draco_color_quantization'] = 10
-            params['export_draco_generic_quantization'] = 12
+        params['export_draco_mesh_compression_enable'] = True
+        params['export_draco_mesh_compression_level'] = settings.get(
+            'export_draco_mesh_compression_level', 6
+        )
+        params['export_draco_position_quantization'] = 14
+        params['export_draco_normal_quantization'] = 10
+        params['export_draco_texcoord_quantization'] = 12
+        params['export_draco_color_quantization'] = 10
+        params['export_draco_generic_quantization'] = 12
     
     # Add image format settings if available
     if 'export_image_format' in settings:
@@ -182,37 +140,40 @@ def get_gltf_export_params(settings, filepath):
     
     # Add image quality if specified
     if 'export_image_quality' in settings:
-        if blender_version >= (3, 3, 0):
+        if _BRANCH != '3.0':
             params['export_image_quality'] = settings['export_image_quality']
     
     # Add texture size limit if specified and supported
     if 'export_texture_size_limit' in settings:
-        if blender_version >= (4, 0, 0):
+        if _BRANCH == '4.0':
             params['export_image_size'] = settings['export_texture_size_limit']
     
     return params
 
 def print_available_gltf_params():
-    """Debug function to print all available GLTF export parameters"""
-    import inspect
-    
-    print("\n[GLTF EXPORT PARAMETERS]")
-    print(f"Blender Version: {bpy.app.version_string}")
-    
+    """Debug function to log all available GLTF export parameters"""
+    # The RNA walk is pure diagnostics; skip it entirely unless someone
+    # turned debug logging on
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+
+    log.debug("[GLTF EXPORT PARAMETERS]")
+    log.debug("Blender Version: %s", bpy.app.version_string)
+
     try:
         # Get the operator
         op = bpy.ops.export_scene.gltf
-        
+
         # Try to get the operator's bl_rna
         if hasattr(op, 'get_rna_type'):
             rna = op.get_rna_type()
             if rna and hasattr(rna, 'properties'):
-                print("\nAvailable parameters:")
+                log.debug("Available parameters:")
                 for prop in rna.properties:
                     if prop.identifier != 'rna_type':
-                        print(f"  - {prop.identifier}: {prop.description}")
+                        log.debug("  - %s: %s", prop.identifier, prop.description)
         else:
-            print("Could not inspect operator parameters")
-            
+            log.debug("Could not inspect operator parameters")
+
     except Exception as e:
-        print(f"Error inspecting GLTF operator: {e}")
\ No newline at end of file
+        log.debug("Error inspecting GLTF operator: %s", e)
\ No newline at end of file
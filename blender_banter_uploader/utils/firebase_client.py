@@ -3,15 +3,55 @@ Firebase client for uploading GLB files and managing entities in Firebase.
 Replaces the previous server-based TippyUploader.
 """
 
+import gzip
 import hashlib
 import json
-import secrets
+import os
+import random
+import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Tuple, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
 
+# gzip level for opt-in compressed upload bodies; GLB mesh buffers are
+# mostly uncompressed binary and typically shrink ~2x on the wire.
+# Compression is off by default because it changes the stored object's
+# Content-Encoding, which every ?alt=media consumer must then decode.
+_GZIP_LEVEL = 6
+
+# Identifiers need uniqueness, not cryptographic strength: a Mersenne
+# Twister seeded once from the OS entropy pool avoids the per-call
+# entropy syscall that secrets.randbelow performed here before
+_RNG = random.Random()
+_RNG.seed(os.urandom(32))
+
+
+def _retry_sleep(attempt):
+    """Capped, jittered backoff between workflow retries.
+
+    The urllib3 adapter only status-retries idempotent methods, so a
+    failed storage POST lands back here; sleep before re-sending the
+    payload instead of hammering a struggling endpoint back-to-back.
+    """
+    time.sleep(min(15.0, 2 ** attempt) * _RNG.uniform(0.5, 1.0))
+
+# Default transform pieces, built once; only ever read and serialized,
+# never handed out for mutation
+_ZERO_V3 = {'x': 0, 'y': 0, 'z': 0}
+_IDENTITY_QUAT = {'x': 0, 'y': 0, 'z': 0, 'w': 1}
+_ONE_V3 = {'x': 1, 'y': 1, 'z': 1}
+_DEFAULT_TRANSFORM = {
+    'position': _ZERO_V3,
+    'rotation': _IDENTITY_QUAT,
+    'scale': _ONE_V3
+}
+
+
 class FirebaseClient:
     """
     Client for interacting with Firebase Storage and Realtime Database.
@@ -39,6 +79,33 @@ class FirebaseClient:
         """
         self.config = config
         self.space_id = space_id
+
+        # One pooled session per client: keep-alive connections are
+        # reused across the storage upload and the database writes, so a
+        # batch pays the TCP/TLS handshake once instead of per request.
+        # Transient failures on idempotent methods retry inside urllib3
+        # with its own backoff. POST is excluded from status retries
+        # because storage uploads stream file bodies that cannot be
+        # rewound; connect-level retries still apply to them, and the
+        # workflow loops in upload_with_retry* cover the rest with
+        # capped-jitter sleeps (_retry_sleep).
+        retry = Retry(
+            total=3,
+            connect=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({'GET', 'PUT', 'PATCH', 'HEAD'}),
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retry)
+        )
+
+        # Small worker pool so the two independent database writes after
+        # a storage upload can run concurrently instead of back to back
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
         self.api_key = config.get('apiKey', '')
         self.storage_bucket = config.get('storageBucket', '')
         self.database_url = config.get('databaseURL', '')
@@ -48,6 +115,22 @@ class FirebaseClient:
         if self.database_url and self.database_url.endswith('/'):
             self.database_url = self.database_url[:-1]
 
+    def close(self):
+        """Release the worker threads and pooled connections.
+
+        Operators build a client per run, so without this every run
+        would leak two idle executor threads and the session's sockets
+        for the rest of the Blender session.
+        """
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test Firebase connection by checking database accessibility.
@@ -61,7 +144,7 @@ class FirebaseClient:
         try:
             # Test database connection with a simple read
             test_url = f"{self.database_url}/.json?auth={self.api_key}&shallow=true&timeout=5s"
-            response = requests.get(test_url, timeout=5)
+            response = self._session.get(test_url, timeout=5)
 
             if response.status_code == 200:
                 return True, "Firebase connection successful"
@@ -77,13 +160,17 @@ class FirebaseClient:
         except Exception as e:
             return False, f"Firebase connection error: {str(e)}"
 
-    def upload_to_storage(self, glb_data: bytes, filename: str) -> Tuple[bool, str, str]:
+    def upload_to_storage(self, glb_data: bytes, filename: str,
+                          compress: bool = False) -> Tuple[bool, str, str]:
         """
         Upload GLB file to Firebase Storage using REST API.
 
         Args:
             glb_data: Binary GLB file data
             filename: Name for the file (without path)
+            compress: gzip the body on the wire. Off by default: Storage
+                keeps the Content-Encoding, so enable this only when the
+                consuming client is known to handle the transcoded object
 
         Returns:
             Tuple of (success: bool, url_or_error: str, storage_path: str)
@@ -95,22 +182,31 @@ class FirebaseClient:
             # Generate file hash for unique naming
             file_hash = hashlib.sha256(glb_data).hexdigest()
             storage_path = f"glbs/{file_hash}.glb"
+            encoded_path = storage_path.replace('/', '%2F')
 
             # Firebase Storage upload URL
             upload_url = (
                 f"https://firebasestorage.googleapis.com/v0/b/{self.storage_bucket}"
-                f"/o/{storage_path.replace('/', '%2F')}?uploadType=media"
+                f"/o/{encoded_path}?uploadType=media"
             )
 
-            # Upload file
-            headers = {
-                'Content-Type': 'model/gltf-binary',
-                'Content-Length': str(len(glb_data))
-            }
+            if compress:
+                body = gzip.compress(glb_data, _GZIP_LEVEL)
+                headers = {
+                    'Content-Type': 'model/gltf-binary',
+                    'Content-Encoding': 'gzip',
+                    'Content-Length': str(len(body))
+                }
+            else:
+                body = glb_data
+                headers = {
+                    'Content-Type': 'model/gltf-binary',
+                    'Content-Length': str(len(glb_data))
+                }
 
-            response = requests.post(
+            response = self._session.post(
                 upload_url,
-                data=glb_data,
+                data=body,
                 headers=headers,
                 params={'key': self.api_key} if self.api_key else None,
                 timeout=60
@@ -120,7 +216,115 @@ class FirebaseClient:
                 # Get download URL
                 download_url = (
                     f"https://firebasestorage.googleapis.com/v0/b/{self.storage_bucket}"
-                    f"/o/{storage_path.replace('/', '%2F')}?alt=media"
+                    f"/o/{encoded_path}?alt=media"
+                )
+                return True, download_url, storage_path
+            else:
+                error_msg = f"Storage upload failed: HTTP {response.status_code}"
+                try:
+                    error_data = response.json()
+                    if 'error' in error_data:
+                        error_msg = f"Storage upload failed: {error_data['error'].get('message', error_msg)}"
+                except:
+                    pass
+                return False, error_msg, ""
+
+        except requests.exceptions.Timeout:
+            return False, "Storage upload timeout", ""
+        except requests.exceptions.ConnectionError:
+            return False, "Cannot connect to Firebase Storage", ""
+        except Exception as e:
+            return False, f"Storage upload error: {str(e)}", ""
+
+    def upload_file_to_storage(self, filepath: str,
+                               precomputed_sha256: Optional[str] = None,
+                               compress: bool = False) -> Tuple[bool, str, str]:
+        """
+        Upload a GLB file to Firebase Storage, streaming from disk.
+
+        Unlike upload_to_storage this never holds the whole file in
+        memory: the HTTP body streams straight from the open file, and
+        the content hash costs one read pass (skipped entirely when the
+        caller supplies precomputed_sha256).
+
+        Args:
+            filepath: Path to the GLB file on disk
+            precomputed_sha256: Hex digest of the file contents, if the
+                caller already computed it (e.g. batch dedup)
+            compress: gzip the body via an on-disk sidecar. Off by
+                default — see upload_to_storage
+
+        Returns:
+            Tuple of (success: bool, url_or_error: str, storage_path: str)
+        """
+        if not self.storage_bucket:
+            return False, "Storage bucket not configured", ""
+
+        try:
+            if precomputed_sha256:
+                file_hash = precomputed_sha256
+            else:
+                hasher = hashlib.sha256()
+                with open(filepath, 'rb') as src:
+                    for chunk in iter(lambda: src.read(1 << 20), b''):
+                        hasher.update(chunk)
+                file_hash = hasher.hexdigest()
+
+            storage_path = f"glbs/{file_hash}.glb"
+            encoded_path = storage_path.replace('/', '%2F')
+            upload_url = (
+                f"https://firebasestorage.googleapis.com/v0/b/{self.storage_bucket}"
+                f"/o/{encoded_path}?uploadType=media"
+            )
+
+            if compress:
+                # Compress next to the source file and stream the
+                # smaller body; the .gz sidecar is removed once the
+                # request returns
+                gz_path = filepath + '.gz'
+                try:
+                    with open(filepath, 'rb') as src, \
+                            gzip.open(gz_path, 'wb', compresslevel=_GZIP_LEVEL) as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+
+                    headers = {
+                        'Content-Type': 'model/gltf-binary',
+                        'Content-Encoding': 'gzip',
+                        'Content-Length': str(os.path.getsize(gz_path))
+                    }
+
+                    with open(gz_path, 'rb', buffering=1 << 20) as f:
+                        response = self._session.post(
+                            upload_url,
+                            data=f,
+                            headers=headers,
+                            params={'key': self.api_key} if self.api_key else None,
+                            timeout=60
+                        )
+                finally:
+                    try:
+                        os.remove(gz_path)
+                    except OSError:
+                        pass
+            else:
+                headers = {
+                    'Content-Type': 'model/gltf-binary',
+                    'Content-Length': str(os.path.getsize(filepath))
+                }
+
+                with open(filepath, 'rb', buffering=1 << 20) as f:
+                    response = self._session.post(
+                        upload_url,
+                        data=f,
+                        headers=headers,
+                        params={'key': self.api_key} if self.api_key else None,
+                        timeout=60
+                    )
+
+            if response.status_code == 200:
+                download_url = (
+                    f"https://firebasestorage.googleapis.com/v0/b/{self.storage_bucket}"
+                    f"/o/{encoded_path}?alt=media"
                 )
                 return True, download_url, storage_path
             else:
@@ -166,7 +370,7 @@ class FirebaseClient:
             }
 
             # Write to database
-            response = requests.put(
+            response = self._session.put(
                 url,
                 json=component_data,
                 params={'auth': self.api_key} if self.api_key else None,
@@ -188,6 +392,27 @@ class FirebaseClient:
         except Exception as e:
             return False, f"Component creation error: {str(e)}"
 
+    def _build_entity_data(self, component_id: str,
+                           transform: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the __meta entity payload shared by single and batch writes"""
+        if transform is None:
+            transform = {}
+        return {
+            "__meta": {
+                "active": True,
+                "components": {
+                    component_id: True
+                },
+                "layer": 0,
+                "localPosition": transform.get('position', _ZERO_V3),
+                "localRotation": transform.get('rotation', _IDENTITY_QUAT),
+                "localScale": transform.get('scale', _ONE_V3),
+                "position": transform.get('position', _ZERO_V3),
+                "rotation": transform.get('rotation', _IDENTITY_QUAT),
+                "uuid": _RNG.randrange(10000000000)
+            }
+        }
+
     def create_entity(self, mesh_name: str, component_id: str,
                      transform: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
         """
@@ -204,41 +429,15 @@ class FirebaseClient:
         if not self.database_url or not self.space_id:
             return False, "Database URL or space ID not configured"
 
-        # Default transform if not provided
-        if transform is None:
-            transform = {
-                'position': {'x': 0, 'y': 0, 'z': 0},
-                'rotation': {'x': 0, 'y': 0, 'z': 0, 'w': 1},
-                'scale': {'x': 1, 'y': 1, 'z': 1}
-            }
-
         try:
             # Entity path in database
             entity_path = f"space/{self.space_id}/Scene/{mesh_name}"
             url = f"{self.database_url}/{entity_path}.json"
 
-            # Generate UUID
-            uuid = secrets.randbelow(10000000000)
-
-            # Entity data structure
-            entity_data = {
-                "__meta": {
-                    "active": True,
-                    "components": {
-                        component_id: True
-                    },
-                    "layer": 0,
-                    "localPosition": transform.get('position', {'x': 0, 'y': 0, 'z': 0}),
-                    "localRotation": transform.get('rotation', {'x': 0, 'y': 0, 'z': 0, 'w': 1}),
-                    "localScale": transform.get('scale', {'x': 1, 'y': 1, 'z': 1}),
-                    "position": transform.get('position', {'x': 0, 'y': 0, 'z': 0}),
-                    "rotation": transform.get('rotation', {'x': 0, 'y': 0, 'z': 0, 'w': 1}),
-                    "uuid": uuid
-                }
-            }
+            entity_data = self._build_entity_data(component_id, transform)
 
             # Write to database
-            response = requests.put(
+            response = self._session.put(
                 url,
                 json=entity_data,
                 params={'auth': self.api_key} if self.api_key else None,
@@ -260,9 +459,105 @@ class FirebaseClient:
         except Exception as e:
             return False, f"Entity creation error: {str(e)}"
 
+    def batch_write_entities(self, entries) -> Tuple[bool, str]:
+        """
+        Write many component + entity records in one request.
+
+        Uses the Realtime Database multi-path update: a single PATCH to
+        the database root whose keys are full paths, applied atomically.
+        A batch of N uploads pays one database round-trip instead of 2N.
+
+        Args:
+            entries: Iterable of dicts with mesh_name, component_id,
+                storage_url and optional transform
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        if not self.database_url or not self.space_id:
+            return False, "Database URL or space ID not configured"
+
+        updates = {}
+        for entry in entries:
+            component_id = entry['component_id']
+            updates[f"space/{self.space_id}/components/{component_id}"] = {
+                "id": component_id,
+                "url": entry['storage_url']
+            }
+            updates[f"space/{self.space_id}/Scene/{entry['mesh_name']}"] = \
+                self._build_entity_data(component_id, entry.get('transform'))
+
+        if not updates:
+            return True, "No entities to write"
+
+        try:
+            response = self._session.patch(
+                f"{self.database_url}/.json",
+                json=updates,
+                params={'auth': self.api_key} if self.api_key else None,
+                timeout=15
+            )
+
+            if response.status_code == 200:
+                return True, f"Wrote {len(entries)} entities in one update"
+            error_msg = f"Batch entity write failed: HTTP {response.status_code}"
+            try:
+                error_data = response.json()
+                if 'error' in error_data:
+                    error_msg = f"Batch entity write failed: {error_data['error']}"
+            except:
+                pass
+            return False, error_msg
+
+        except Exception as e:
+            return False, f"Batch entity write error: {str(e)}"
+
+    def upload_file_with_retry(self, filepath: str, max_retries: int = 3,
+                               precomputed_sha256: Optional[str] = None,
+                               delete_after: bool = True,
+                               compress: bool = False) -> Tuple[bool, str]:
+        """
+        Storage-only upload with retry; writes no database records.
+
+        Used by the batch operator, which collects the storage URLs of a
+        whole batch and then lands every component and entity record in
+        one batch_write_entities PATCH instead of two writes per item.
+
+        Args:
+            filepath: Path to the GLB file on disk
+            max_retries: Maximum number of attempts
+            precomputed_sha256: Hex digest of the file contents, if known
+            delete_after: Remove the file once the upload settles
+
+        Returns:
+            Tuple of (success: bool, url_or_error: str)
+        """
+        url_or_error = "Maximum retries exceeded"
+        try:
+            for attempt in range(max_retries):
+                try:
+                    success, url_or_error, _ = self.upload_file_to_storage(
+                        filepath, precomputed_sha256=precomputed_sha256,
+                        compress=compress
+                    )
+                except Exception as e:
+                    success, url_or_error = False, f"Upload failed: {str(e)}"
+                if success:
+                    return True, url_or_error
+                if attempt < max_retries - 1:
+                    _retry_sleep(attempt)
+            return False, url_or_error
+        finally:
+            if delete_after:
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
+
     def upload_with_retry(self, glb_data: bytes, mesh_name: str,
                          transform: Optional[Dict[str, Any]] = None,
-                         max_retries: int = 3) -> Dict[str, Any]:
+                         max_retries: int = 3,
+                         compress: bool = False) -> Dict[str, Any]:
         """
         Complete upload workflow with retry logic.
 
@@ -287,30 +582,36 @@ class FirebaseClient:
         for attempt in range(max_retries):
             try:
                 # Generate component ID
-                component_id = f"GLTF_{secrets.randbelow(1000000000)}"
+                component_id = f"GLTF_{_RNG.randrange(1000000000)}"
 
                 # Step 1: Upload to Storage
                 success, url_or_error, storage_path = self.upload_to_storage(
-                    glb_data, f"{mesh_name}.glb"
+                    glb_data, f"{mesh_name}.glb", compress=compress
                 )
 
                 if not success:
                     if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
+                        _retry_sleep(attempt)
                         continue
                     return {'success': False, 'error': url_or_error}
 
                 storage_url = url_or_error
 
-                # Step 2: Create component
-                success, message = self.create_component(component_id, storage_url)
-                if not success:
-                    return {'success': False, 'error': message}
-
-                # Step 3: Create entity
-                success, message = self.create_entity(mesh_name, component_id, transform)
-                if not success:
-                    return {'success': False, 'error': message}
+                # Steps 2 + 3: the component and entity records are
+                # independent writes, so overlap them — component on the
+                # worker pool, entity on this thread — and pay one
+                # round-trip of latency instead of two
+                component_future = self._executor.submit(
+                    self.create_component, component_id, storage_url
+                )
+                entity_ok, entity_msg = self.create_entity(
+                    mesh_name, component_id, transform
+                )
+                component_ok, component_msg = component_future.result()
+                if not component_ok:
+                    return {'success': False, 'error': component_msg}
+                if not entity_ok:
+                    return {'success': False, 'error': entity_msg}
 
                 # Success!
                 return {
@@ -322,12 +623,95 @@ class FirebaseClient:
 
             except Exception as e:
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    _retry_sleep(attempt)
                     continue
                 return {'success': False, 'error': f"Upload failed: {str(e)}"}
 
         return {'success': False, 'error': "Maximum retries exceeded"}
 
+    def upload_with_retry_file(self, filepath: str, mesh_name: str,
+                               transform: Optional[Dict[str, Any]] = None,
+                               max_retries: int = 3,
+                               delete_after: bool = True,
+                               known_storage_url: Optional[str] = None,
+                               precomputed_sha256: Optional[str] = None,
+                               compress: bool = False) -> Dict[str, Any]:
+        """
+        File-based variant of upload_with_retry that streams from disk.
+
+        Args:
+            filepath: Path to the exported GLB file
+            mesh_name: Name of the mesh/entity
+            transform: Optional transform data
+            max_retries: Maximum number of retry attempts
+            delete_after: Remove the file once the workflow finishes
+            known_storage_url: Storage URL of an already-uploaded copy of
+                this exact payload; when given the storage upload is
+                skipped and only the component/entity records are created
+            precomputed_sha256: Hex digest of the file contents, if the
+                caller already computed it
+
+        Returns:
+            Same result dictionary as upload_with_retry.
+        """
+        try:
+            for attempt in range(max_retries):
+                try:
+                    # Generate component ID
+                    component_id = f"GLTF_{_RNG.randrange(1000000000)}"
+
+                    if known_storage_url:
+                        storage_url = known_storage_url
+                    else:
+                        # Step 1: Upload to Storage (streamed)
+                        success, url_or_error, storage_path = self.upload_file_to_storage(
+                            filepath, precomputed_sha256=precomputed_sha256,
+                            compress=compress
+                        )
+
+                        if not success:
+                            if attempt < max_retries - 1:
+                                _retry_sleep(attempt)
+                                continue
+                            return {'success': False, 'error': url_or_error}
+
+                        storage_url = url_or_error
+
+                    # Steps 2 + 3: overlap the independent component and
+                    # entity writes, same as upload_with_retry
+                    component_future = self._executor.submit(
+                        self.create_component, component_id, storage_url
+                    )
+                    entity_ok, entity_msg = self.create_entity(
+                        mesh_name, component_id, transform
+                    )
+                    component_ok, component_msg = component_future.result()
+                    if not component_ok:
+                        return {'success': False, 'error': component_msg}
+                    if not entity_ok:
+                        return {'success': False, 'error': entity_msg}
+
+                    return {
+                        'success': True,
+                        'storage_url': storage_url,
+                        'component_id': component_id,
+                        'mesh_name': mesh_name
+                    }
+
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        _retry_sleep(attempt)
+                        continue
+                    return {'success': False, 'error': f"Upload failed: {str(e)}"}
+
+            return {'success': False, 'error': "Maximum retries exceeded"}
+        finally:
+            if delete_after:
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
+
 
 def generate_component_id() -> str:
     """
@@ -336,7 +720,7 @@ def generate_component_id() -> str:
     Returns:
         Component ID in format "GLTF_<random_number>"
     """
-    return f"GLTF_{secrets.randbelow(1000000000)}"
+    return f"GLTF_{_RNG.randrange(1000000000)}"
 
 
 def get_transform_data(obj) -> Dict[str, Dict[str, float]]:
@@ -350,10 +734,9 @@ def get_transform_data(obj) -> Dict[str, Dict[str, float]]:
         Dictionary with position, rotation, and scale data
     """
     try:
-        matrix = obj.matrix_world
-        location = matrix.to_translation()
-        rotation = matrix.to_quaternion()
-        scale = matrix.to_scale()
+        # decompose() factors the matrix once; the separate
+        # to_translation/to_quaternion/to_scale calls each redid the work
+        location, rotation, scale = obj.matrix_world.decompose()
 
         return {
             'position': {'x': location.x, 'y': location.y, 'z': location.z},
@@ -362,8 +745,4 @@ def get_transform_data(obj) -> Dict[str, Dict[str, float]]:
         }
     except Exception:
         # Return default transform if extraction fails
-        return {
-            'position': {'x': 0, 'y': 0, 'z': 0},
-            'rotation': {'x': 0, 'y': 0, 'z': 0, 'w': 1},
-            'scale': {'x': 1, 'y': 1, 'z': 1}
-        }
\ No newline at end of file
+        return _DEFAULT_TRANSFORM
\ No newline at end of file
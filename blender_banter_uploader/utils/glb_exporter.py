@@ -1,14 +1,17 @@
 import bpy
+import logging
 import os
 import tempfile
 from pathlib import Path
 from .. import config
 from .blender_compat import get_gltf_export_params
 
+log = logging.getLogger(__name__)
+
 class GLBExporter:
     
     @staticmethod
-    def export_selection(objects, filepath=None, settings=None):
+    def export_selection(objects, filepath=None, settings=None, return_bytes=True):
         """
         Export selected objects as GLB file.
         
@@ -16,9 +19,14 @@ class GLBExporter:
             objects: List of Blender objects to export
             filepath: Optional output filepath. If None, creates temp file
             settings: Export settings dict. If None, uses default preset
+            return_bytes: If True, read the file into memory and remove
+                temp files. If False, leave the file on disk and return
+                (filepath, None); the caller owns cleanup. This keeps
+                large GLBs out of RAM so uploads can stream from disk.
             
         Returns:
-            tuple: (filepath, file_data_bytes) - Path to exported file and bytes data
+            tuple: (filepath, file_data_bytes) - Path to exported file and
+                bytes data (None when return_bytes is False)
         """
         if not objects:
             raise ValueError("No objects selected for export")
@@ -31,55 +39,58 @@ class GLBExporter:
         else:
             is_temp = False
         
-        # Get export settings
+        # Get export settings (presets are read-only and only read from)
         if settings is None:
-            settings = config.EXPORT_PRESETS[config.DEFAULT_EXPORT_PRESET].copy()
+            settings = config.EXPORT_PRESETS[config.DEFAULT_EXPORT_PRESET]
         
-        # Store current selection
+        # Get version-compatible export parameters
+        export_params = get_gltf_export_params(settings, filepath)
+
+        GLBExporter._run_gltf_export(objects, export_params, filepath)
+
+        if not return_bytes:
+            return filepath, None
+
+        # Read file data
+        with open(filepath, 'rb') as f:
+            file_data = f.read()
+
+        # Clean up temp file if needed
+        if is_temp:
+            try:
+                os.remove(filepath)
+            except:
+                pass
+
+        return filepath, file_data
+
+    @staticmethod
+    def _run_gltf_export(objects, export_params, filepath):
+        """Run the gltf exporter against `objects` as the selection.
+
+        The exporter's use_selection filter reads the real per-object
+        select flags (Object.select_get), not context.selected_objects,
+        so a temp_override of the context member is not honored — the
+        selection has to be mutated for real and restored afterwards.
+        """
         original_selection = bpy.context.selected_objects.copy()
         original_active = bpy.context.view_layer.objects.active
-        
         try:
-            # Clear selection and select only objects to export
             bpy.ops.object.select_all(action='DESELECT')
             for obj in objects:
                 obj.select_set(True)
-            
-            if objects:
-                bpy.context.view_layer.objects.active = objects[0]
-            
-            # Get version-compatible export parameters
-            export_params = get_gltf_export_params(settings, filepath)
-            
-            # Export the GLB
+            bpy.context.view_layer.objects.active = objects[0]
+
             try:
                 bpy.ops.export_scene.gltf(**export_params)
             except TypeError as e:
-                # If parameters fail, try with minimal params
-                print(f"Export with full params failed: {e}")
-                print("Trying with minimal parameters...")
-                minimal_params = {
-                    'filepath': filepath,
-                    'export_format': 'GLB',
-                    'use_selection': True,
-                }
-                bpy.ops.export_scene.gltf(**minimal_params)
-            
-            # Read file data
-            with open(filepath, 'rb') as f:
-                file_data = f.read()
-            
-            # Clean up temp file if needed
-            if is_temp:
-                try:
-                    os.remove(filepath)
-                except:
-                    pass
-            
-            return filepath, file_data
-            
+                log.warning("Export with full params failed: %s; retrying with minimal parameters", e)
+                bpy.ops.export_scene.gltf(
+                    filepath=filepath,
+                    export_format='GLB',
+                    use_selection=True,
+                )
         finally:
-            # Restore original selection
             bpy.ops.object.select_all(action='DESELECT')
             for obj in original_selection:
                 if obj and obj.name in bpy.data.objects:
@@ -130,27 +141,18 @@ class GLBExporter:
         Returns:
             int: Estimated file size in bytes
         """
-        total_size = 0
-        
-        for obj in objects:
-            # Estimate mesh data
-            if obj.type == 'MESH':
-                mesh = obj.data
-                # Rough estimate: vertices * 12 bytes + faces * 12 bytes
-                vertex_size = len(mesh.vertices) * 12
-                face_size = len(mesh.polygons) * 12
-                total_size += vertex_size + face_size
-                
-                # Add material/texture estimates
-                for mat_slot in obj.material_slots:
-                    if mat_slot.material:
-                        # Add rough texture size estimate (1MB per texture)
-                        total_size += 1024 * 1024
-        
+        # Rough estimate: vertices and faces at 12 bytes each plus 1MB
+        # per filled material slot; len() on RNA collections is O(1), so
+        # this stays cheap even for dense meshes
+        total_size = sum(
+            len(obj.data.vertices) * 12
+            + len(obj.data.polygons) * 12
+            + sum(1 for slot in obj.material_slots if slot.material) * (1024 * 1024)
+            for obj in objects if obj.type == 'MESH'
+        )
+
         # Add overhead for GLB structure (roughly 20%)
-        total_size = int(total_size * 1.2)
-        
-        return total_size
+        return int(total_size * 1.2)
     
     @staticmethod
     def get_poly_count(objects):
@@ -163,10 +165,6 @@ class GLBExporter:
         Returns:
             int: Total polygon count
         """
-        total_polys = 0
-        
-        for obj in objects:
-            if obj.type == 'MESH':
-                total_polys += len(obj.data.polygons)
-        
-        return total_polys
\ No newline at end of file
+        # len() on an RNA collection is an O(1) length read, so the sum
+        # costs one call per mesh object regardless of face count
+        return sum(len(obj.data.polygons) for obj in objects if obj.type == 'MESH')
\ No newline at end of file
@@ -1,40 +1,219 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import hashlib
+import os
+import random
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 from .. import config
 
+
+def _iter_multipart(data_fields, filename, file_obj, file_size, content_type,
+                    boundary, progress_callback=None, chunk_size=1 << 20):
+    """
+    Generate a multipart/form-data body chunk by chunk.
+
+    Passing bytes (or an open file) through requests' `files=` builds
+    the full multipart body in memory next to the payload — roughly 2x
+    the file size at peak. Streaming the body from a generator keeps
+    one chunk buffer alive instead, and gives a natural place to report
+    upload progress.
+    """
+    for name, value in data_fields.items():
+        yield (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f'{value}\r\n'
+        ).encode()
+
+    yield (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f'Content-Type: {content_type}\r\n\r\n'
+    ).encode()
+
+    sent = 0
+    while chunk := file_obj.read(chunk_size):
+        sent += len(chunk)
+        if progress_callback and file_size:
+            progress_callback(int(100 * sent / file_size), "Uploading...")
+        yield chunk
+
+    yield f'\r\n--{boundary}--\r\n'.encode()
+
+
+# Background upload workers, created on first use so importing this
+# module stays free of thread spawn cost
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2)
+    return _executor
+
+
+def _throttle_progress(progress_callback, interval=0.25):
+    """
+    Rate-limit a progress callback to one call per interval.
+
+    The streamed upload reports per chunk, and each report typically
+    triggers an area redraw — expensive enough to slow the transfer it
+    describes. Start (0) and completion (100) always pass through.
+    """
+    last_call = [0.0]
+
+    def wrapped(pct, msg):
+        now = time.monotonic()
+        if pct in (0, 100) or now - last_call[0] >= interval:
+            last_call[0] = now
+            progress_callback(pct, msg)
+
+    return wrapped
+
+
+def _gzip_stream(chunks, level=6):
+    """Gzip-compress a chunk generator on the fly (one chunk resident)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+# Above this size, a local verification hash costs a full extra CPU
+# pass over the payload; fall back to the hash the server returns
+_VERIFY_THRESHOLD = 256 << 20
+
+
+def _hash_file(file_obj):
+    """
+    SHA-256 hex digest of an open binary file.
+
+    Python 3.11+ exposes hashlib.file_digest, whose zero-copy read loop
+    lets OpenSSL run its hardware-accelerated SHA path over large
+    buffers; older interpreters (Blender 3.x ships 3.10) fall back to
+    the chunked update loop.
+    """
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(file_obj, 'sha256').hexdigest()
+    hasher = hashlib.sha256()
+    while chunk := file_obj.read(1 << 20):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 class TippyUploader:
 
+    # Shared keep-alive session: repeated uploads and status probes reuse
+    # one pooled connection instead of a fresh TCP/TLS handshake each.
+    # Transient connect failures and 5xx responses on idempotent methods
+    # retry inside urllib3 with backoff; uploads stream generator bodies
+    # that cannot be replayed at that layer, so POST recovery stays in
+    # upload_with_retry
+    _session = requests.Session()
+    _session.mount('https://', HTTPAdapter(
+        pool_connections=4, pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            backoff_factor=2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+        )
+    ))
+
+    # Most recent server probe, reused within the TTL so quick repeat
+    # exports don't pay an HTTP round trip per run
+    _last_status_url = None
+    _last_status_ok = False
+    _last_status_ts = 0.0
+    _last_status_etag = None
+    _STATUS_CACHE_SECONDS = 60.0
+
     @staticmethod
-    def upload_glb(glb_data, server_url=None, username=None, secret=None, mesh_name=None, progress_callback=None):
+    def upload_glb(glb_data=None, server_url=None, username=None, secret=None, mesh_name=None, progress_callback=None, glb_path=None, compress=False, verify_locally=None):
         """
         Upload GLB data to Tippy microservice.
 
         Args:
-            glb_data: Bytes data of GLB file
+            glb_data: Bytes data of GLB file (exclusive with glb_path)
             server_url: Optional server URL override
             username: Username for authentication
             secret: Secret key for authentication
             mesh_name: Name of the mesh/object being uploaded
             progress_callback: Optional callback for progress updates
+            glb_path: Path to a GLB file on disk; when given, the hash
+                is computed in 1 MB chunks and the request body streams
+                from the open file, so the payload never sits in memory
+            compress: Gzip the streamed body on the wire (Content-
+                Encoding: gzip); only enable against servers that
+                decode it. GLB JSON+buffer chunks typically shrink ~2x
+            verify_locally: Compute a local SHA-256 for verification.
+                Defaults to True below 256 MB; above that the extra CPU
+                pass is skipped and the server-reported hash stands
 
         Returns:
             dict: Response from server containing hash and other metadata
         """
+        if glb_data is None and glb_path is None:
+            raise ValueError("Either glb_data or glb_path is required")
+
         if server_url is None:
             server_url = config.DEFAULT_SERVER_URL
 
         # Construct upload URL
         upload_url = f"{server_url}/api/store_glb"
 
-        # Calculate hash for reference
-        local_hash = hashlib.sha256(glb_data).hexdigest()
+        if progress_callback:
+            progress_callback = _throttle_progress(progress_callback)
 
+        if verify_locally is None:
+            size = len(glb_data) if glb_data is not None else os.path.getsize(glb_path)
+            verify_locally = size < _VERIFY_THRESHOLD
+
+        file_obj = None
+        local_hash = None
         try:
-            # Prepare multipart form data
-            files = {'file': ('model.glb', glb_data, 'model/gltf-binary')}
+            # Calculate hash for reference; the chunked loop keeps peak
+            # memory at one buffer instead of the whole file
+            if glb_path is not None:
+                file_obj = open(glb_path, 'rb')
+                if verify_locally:
+                    local_hash = _hash_file(file_obj)
+                    file_obj.seek(0)
+                payload = file_obj
+            else:
+                if verify_locally:
+                    local_hash = hashlib.sha256(glb_data).hexdigest()
+                payload = glb_data
 
+            # Conditional-request dedup: re-exports of unchanged meshes
+            # produce identical bytes, and a 304 from the server means
+            # it already holds this content — skip the POST entirely
+            if local_hash is not None:
+                try:
+                    probe = TippyUploader._session.head(
+                        upload_url,
+                        headers={'If-None-Match': f'"{local_hash}"'},
+                        timeout=5
+                    )
+                    if probe.status_code == 304:
+                        if progress_callback:
+                            progress_callback(100, "Already uploaded")
+                        return {'hash': local_hash, 'local_hash': local_hash,
+                                'cached': True}
+                except requests.exceptions.RequestException:
+                    # Probe failures fall through to the normal upload
+                    pass
+            
             # Add authentication and metadata if provided
             data = {}
             if username:
@@ -48,12 +227,36 @@ class TippyUploader:
             if progress_callback:
                 progress_callback(0, "Starting upload...")
             
-            response = requests.post(
-                upload_url,
-                files=files,
-                data=data,  # Add form data with username and secret
-                timeout=60  # 60 second timeout for large files
-            )
+            if file_obj is not None:
+                # Stream the multipart body straight from disk; no
+                # second in-memory copy of the payload
+                boundary = uuid.uuid4().hex
+                file_size = os.path.getsize(glb_path)
+                body = _iter_multipart(
+                    data, 'model.glb', file_obj, file_size,
+                    'model/gltf-binary', boundary, progress_callback
+                )
+                headers = {'Content-Type': f'multipart/form-data; boundary={boundary}'}
+                if compress:
+                    # Compression interleaves with the socket writes, so
+                    # bandwidth-bound uploads shrink by the ratio
+                    body = _gzip_stream(body)
+                    headers['Content-Encoding'] = 'gzip'
+                    headers['X-Original-Size'] = str(file_size)
+                response = TippyUploader._session.post(
+                    upload_url,
+                    data=body,
+                    headers=headers,
+                    timeout=60  # 60 second timeout for large files
+                )
+            else:
+                files = {'file': ('model.glb', payload, 'model/gltf-binary')}
+                response = TippyUploader._session.post(
+                    upload_url,
+                    files=files,
+                    data=data,  # Add form data with username and secret
+                    timeout=60  # 60 second timeout for large files
+                )
             
             if progress_callback:
                 progress_callback(100, "Upload complete!")
@@ -64,8 +267,9 @@ class TippyUploader:
             # Parse response
             result = response.json()
             
-            # Add local hash for verification
-            result['local_hash'] = local_hash
+            # Add local hash for verification when it was computed
+            if local_hash is not None:
+                result['local_hash'] = local_hash
             
             return result
             
@@ -82,12 +286,159 @@ class TippyUploader:
             raise ValueError("Invalid response from server")
         except Exception as e:
             raise Exception(f"Upload failed: {str(e)}")
+        finally:
+            if file_obj is not None:
+                file_obj.close()
     
+    @staticmethod
+    def upload_with_retry_async(on_done, *args, **kwargs):
+        """
+        Run upload_with_retry on a worker thread, keeping the UI alive.
+
+        A synchronous upload stalls Blender's main thread for the whole
+        POST. This submits the upload to a small executor and polls the
+        future from a bpy.app.timers tick, so both the completion
+        callback and any progress updates land back on the main thread,
+        where Blender APIs are safe to call.
+
+        Args:
+            on_done: Called on the main thread as on_done(result, error);
+                exactly one of the two is None
+            *args, **kwargs: Forwarded to upload_with_retry
+
+        Returns:
+            concurrent.futures.Future for the upload
+        """
+        import bpy  # deferred so this module stays importable headless
+
+        # Progress events are queued off-thread and replayed on the
+        # timer tick; list append is GIL-atomic
+        progress_events = []
+        user_progress = kwargs.get('progress_callback')
+        if user_progress:
+            kwargs['progress_callback'] = (
+                lambda pct, msg: progress_events.append((pct, msg))
+            )
+
+        future = _get_executor().submit(
+            TippyUploader.upload_with_retry, *args, **kwargs
+        )
+
+        def _poll():
+            while progress_events:
+                pct, msg = progress_events.pop(0)
+                user_progress(pct, msg)
+            if not future.done():
+                return 0.1
+            error = future.exception()
+            on_done(None if error else future.result(), error)
+            return None
+
+        bpy.app.timers.register(_poll, first_interval=0.1)
+        return future
+
+    @staticmethod
+    def upload_glb_chunked(glb_path, server_url=None, username=None, secret=None,
+                           mesh_name=None, part_size=6 << 20, concurrency=3,
+                           max_retries=3, progress_callback=None):
+        """
+        Upload a large GLB in fixed-size parts that retry independently.
+
+        A transient failure mid-transfer costs one part (default 6 MB)
+        instead of the whole file, and parts upload in parallel —
+        capped at 3, which beats unlimited fan-out on slow links. Each
+        part carries its own SHA-256 so the server can verify pieces as
+        they land.
+
+        Args:
+            glb_path: Path to the GLB file on disk
+            server_url: Optional server URL override
+            username: Username for authentication
+            secret: Secret key for authentication
+            mesh_name: Name of the mesh/object being uploaded
+            part_size: Bytes per part
+            concurrency: Parallel part uploads
+            max_retries: Attempts per part before giving up
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            dict: Response from the finalize call
+        """
+        if server_url is None:
+            server_url = config.DEFAULT_SERVER_URL
+
+        upload_id = uuid.uuid4().hex
+        file_size = os.path.getsize(glb_path)
+        part_count = max(1, -(-file_size // part_size))
+        done = [0]
+
+        def _send_part(index):
+            with open(glb_path, 'rb') as f:
+                f.seek(index * part_size)
+                chunk = f.read(part_size)
+            part_hash = hashlib.sha256(chunk).hexdigest()
+
+            last_error = None
+            for attempt in range(max_retries):
+                try:
+                    response = TippyUploader._session.post(
+                        f"{server_url}/api/store_glb/part",
+                        params={'upload_id': upload_id, 'index': index},
+                        data=chunk,
+                        headers={
+                            'Content-Type': 'application/octet-stream',
+                            'X-Part-SHA256': part_hash,
+                        },
+                        timeout=60
+                    )
+                    response.raise_for_status()
+                    done[0] += 1
+                    if progress_callback:
+                        progress_callback(
+                            int(100 * done[0] / part_count),
+                            f"Uploaded part {done[0]}/{part_count}"
+                        )
+                    return
+                except Exception as e:
+                    last_error = e
+                    if attempt < max_retries - 1:
+                        time.sleep(min(15.0, 2 ** attempt) * random.uniform(0.5, 1.0))
+            raise last_error
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                # list() propagates the first part failure
+                list(pool.map(_send_part, range(part_count)))
+
+            data = {'upload_id': upload_id, 'parts': part_count, 'size': file_size}
+            if username:
+                data['username'] = username
+            if secret:
+                data['secret'] = secret
+            if mesh_name:
+                data['mesh_name'] = mesh_name
+
+            response = TippyUploader._session.post(
+                f"{server_url}/api/store_glb/complete",
+                data=data,
+                timeout=60
+            )
+            response.raise_for_status()
+            return response.json()
+
+        except requests.exceptions.ConnectionError:
+            raise ConnectionError(f"Cannot connect to server at {server_url}")
+        except requests.exceptions.Timeout:
+            raise TimeoutError("Upload timed out - file may be too large")
+
     @staticmethod
     def check_server_status(server_url=None):
         """
         Check if the server is available.
-        
+
+        The result is cached per URL for a short TTL so repeated checks
+        within the same editing session skip the network round trip.
+
         Args:
             server_url: Optional server URL override
             
@@ -96,16 +447,42 @@ class TippyUploader:
         """
         if server_url is None:
             server_url = config.DEFAULT_SERVER_URL
-        
+
+        now = time.monotonic()
+        if (TippyUploader._last_status_url == server_url
+                and now - TippyUploader._last_status_ts < TippyUploader._STATUS_CACHE_SECONDS):
+            return TippyUploader._last_status_ok
+
         try:
-            # Try to connect to the server root
-            response = requests.get(server_url, timeout=5)
-            return response.status_code < 500
+            # HEAD against the server root: availability is all we need,
+            # so skip the body, and keep the timeouts tight (1 s connect,
+            # 1 s read) so a dead server stalls the caller briefly.
+            # Revalidate with If-None-Match when a previous probe gave
+            # us an ETag: a 304 answer carries no body at all, and 304
+            # (like any status below 500) means the server is up.
+            headers = None
+            if (TippyUploader._last_status_etag
+                    and TippyUploader._last_status_url == server_url):
+                headers = {'If-None-Match': TippyUploader._last_status_etag}
+            response = TippyUploader._session.head(
+                server_url, timeout=(1.0, 1.0), allow_redirects=True,
+                headers=headers
+            )
+            is_up = response.status_code < 500
+            etag = response.headers.get('ETag',
+                                        TippyUploader._last_status_etag)
         except:
-            return False
+            is_up = False
+            etag = None
+
+        TippyUploader._last_status_url = server_url
+        TippyUploader._last_status_ok = is_up
+        TippyUploader._last_status_ts = now
+        TippyUploader._last_status_etag = etag
+        return is_up
     
     @staticmethod
-    def upload_with_retry(glb_data, server_url=None, username=None, secret=None, mesh_name=None, max_retries=3, progress_callback=None):
+    def upload_with_retry(glb_data, server_url=None, username=None, secret=None, mesh_name=None, max_retries=3, progress_callback=None, retry_factor=2, retry_max_time=15.0):
         """
         Upload with automatic retry on failure.
 
@@ -117,6 +494,8 @@ class TippyUploader:
             mesh_name: Name of the mesh/object being uploaded
             max_retries: Maximum number of retry attempts
             progress_callback: Optional callback for progress updates
+            retry_factor: Exponential backoff base between attempts
+            retry_max_time: Ceiling in seconds for any single backoff
 
         Returns:
             dict: Response from server
@@ -140,9 +519,13 @@ class TippyUploader:
             except (ConnectionError, TimeoutError) as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    # Wait before retry (exponential backoff)
-                    import time
-                    time.sleep(2 ** attempt)
+                    # Capped exponential backoff with jitter: the cap
+                    # bounds tail latency and the jitter keeps several
+                    # clients from retrying in lockstep
+                    time.sleep(
+                        min(retry_max_time, retry_factor ** attempt)
+                        * random.uniform(0.5, 1.0)
+                    )
                 continue
             except Exception as e:
                 # Don't retry on other errors
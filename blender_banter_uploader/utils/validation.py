@@ -1,15 +1,77 @@
 import bpy
+import os
 from .. import config
 
+# Validation results per selection signature; any depsgraph update
+# (geometry, materials, modifiers) clears it, so a hit means the scene
+# is unchanged since the last full traversal. Draw code can then call
+# validate_selection every redraw without re-walking mesh data.
+_validation_cache = {}
+
+# Size thresholds in bytes, computed once so the per-call comparison is
+# a plain integer compare with no float divide
+_MAX_BYTES = config.MAX_FILE_SIZE_MB * 1024 * 1024
+_WARN_BYTES = int(_MAX_BYTES * 0.8)
+
+# Fused material-scan results, same lifetime as the validation cache
+_material_scan_cache = {}
+
+
+def _invalidate_validation_cache(scene, depsgraph=None):
+    """Drop memoized validation results whenever the scene changes"""
+    _validation_cache.clear()
+    _material_scan_cache.clear()
+
+
+def _ensure_invalidation_handler():
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if _invalidate_validation_cache not in handlers:
+        handlers.append(_invalidate_validation_cache)
+
+
+def remove_invalidation_handler():
+    """Detach the handler and drop the caches; called at unregister"""
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if _invalidate_validation_cache in handlers:
+        handlers.remove(_invalidate_validation_cache)
+    _validation_cache.clear()
+    _material_scan_cache.clear()
+
+
 class ValidationHelper:
     
     @staticmethod
-    def validate_selection(objects):
+    def get_mesh_stats(objects):
+        """
+        Collect per-object mesh statistics in a single pass.
+        
+        Args:
+            objects: List of objects to scan
+            
+        Returns:
+            dict: {object: (poly_count, vertex_count, material_count)}
+                  for mesh objects only
+        """
+        stats = {}
+        for obj in objects:
+            if obj.type == 'MESH' and obj not in stats:
+                mesh = obj.data
+                stats[obj] = (
+                    len(mesh.polygons),
+                    len(mesh.vertices),
+                    sum(1 for slot in obj.material_slots if slot.material),
+                )
+        return stats
+    
+    @staticmethod
+    def validate_selection(objects, mesh_stats=None):
         """
         Validate objects for export.
         
         Args:
             objects: List of objects to validate
+            mesh_stats: Optional precomputed stats from get_mesh_stats(),
+                so batch callers don't re-read RNA counts per item
             
         Returns:
             tuple: (is_valid, warnings, errors)
@@ -21,92 +83,158 @@ class ValidationHelper:
             errors.append("No objects selected")
             return False, warnings, errors
         
-        # Check for mesh data
-        has_mesh = False
-        for obj in objects:
-            if obj.type == 'MESH':
-                has_mesh = True
-                break
+        _ensure_invalidation_handler()
+        cache_key = tuple(sorted(obj.as_pointer() for obj in objects))
+        cached = _validation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if mesh_stats is None:
+            mesh_stats = ValidationHelper.get_mesh_stats(objects)
         
-        if not has_mesh:
+        # Filter to mesh objects once; every check below reuses this
+        # list instead of re-testing obj.type (or stats membership)
+        meshes = [obj for obj in objects if obj in mesh_stats]
+        
+        if not meshes:
             errors.append("Selection contains no mesh objects")
         
         # Check polygon count
-        from .glb_exporter import GLBExporter
-        poly_count = GLBExporter.get_poly_count(objects)
+        poly_count = sum(mesh_stats[obj][0] for obj in meshes)
         
         if poly_count > config.MAX_POLY_COUNT_PC_VR:
             warnings.append(f"High polygon count ({poly_count:,}) may impact performance")
         elif poly_count > config.MAX_POLY_COUNT_MOBILE_VR:
             warnings.append(f"Polygon count ({poly_count:,}) exceeds mobile VR recommendation")
         
-        # Check for missing textures
-        missing_textures = ValidationHelper.check_missing_textures(objects)
+        # One fused traversal covers textures and modifiers
+        missing_textures, _, problematic_modifiers = \
+            ValidationHelper._scan_materials(meshes)
         if missing_textures:
             warnings.append(f"Missing textures: {', '.join(missing_textures)}")
         
-        # Estimate file size
-        estimated_size = GLBExporter.estimate_file_size(objects)
-        size_mb = estimated_size / (1024 * 1024)
+        # Estimate file size from the same stats pass
+        # (mirrors GLBExporter.estimate_file_size: 12 bytes per vertex and
+        # polygon, ~1MB per material, plus 20% GLB overhead)
+        estimated_size = int(sum(
+            mesh_stats[obj][0] * 12 + mesh_stats[obj][1] * 12
+            + mesh_stats[obj][2] * 1024 * 1024
+            for obj in meshes
+        ) * 1.2)
         
-        if size_mb > config.MAX_FILE_SIZE_MB:
-            errors.append(f"Estimated file size ({size_mb:.1f}MB) exceeds maximum ({config.MAX_FILE_SIZE_MB}MB)")
-        elif size_mb > config.MAX_FILE_SIZE_MB * 0.8:
-            warnings.append(f"File size ({size_mb:.1f}MB) approaching maximum limit")
+        # Compare bytes directly; only format the MB string when a
+        # message is actually emitted
+        if estimated_size > _MAX_BYTES:
+            errors.append(
+                f"Estimated file size ({estimated_size / (1024 * 1024):.1f}MB) "
+                f"exceeds maximum ({config.MAX_FILE_SIZE_MB}MB)"
+            )
+        elif estimated_size > _WARN_BYTES:
+            warnings.append(
+                f"File size ({estimated_size / (1024 * 1024):.1f}MB) "
+                f"approaching maximum limit"
+            )
         
         # Check for modifiers that might cause issues
-        problematic_modifiers = ValidationHelper.check_modifiers(objects)
         if problematic_modifiers:
             warnings.append(f"Objects have modifiers that will be applied: {', '.join(problematic_modifiers)}")
         
         # Determine if valid
         is_valid = len(errors) == 0
         
-        return is_valid, warnings, errors
+        result = (is_valid, warnings, errors)
+        _validation_cache[cache_key] = result
+        return result
     
     @staticmethod
-    def check_missing_textures(objects):
+    def _scan_materials(objects):
         """
-        Check for missing texture files.
+        One traversal collecting everything the checks below need.
+        
+        check_missing_textures, check_texture_sizes and check_modifiers
+        each walked objects -> material_slots -> node_tree.nodes
+        separately; RNA attribute access dominates that cost, so the
+        three sweeps are fused and the result memoized alongside the
+        validation cache.
         
-        Args:
-            objects: List of objects to check
-            
         Returns:
-            list: Names of missing textures
+            tuple: (missing_textures, large_textures, objects_with_modifiers)
         """
+        _ensure_invalidation_handler()
+        cache_key = tuple(sorted(obj.as_pointer() for obj in objects))
+        cached = _material_scan_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         missing = []
+        large_textures = {}
+        objects_with_modifiers = []
         checked = set()
+        seen_images = set()
+        # One stat per distinct texture path per scan; shared textures
+        # otherwise hit the filesystem once per referencing node
+        path_exists = {}
         
-        for obj in objects:
-            if obj.type != 'MESH':
-                continue
+        # Single filter up front; the loop body then runs branch-free
+        # over mesh objects even when callers pass a raw selection
+        for obj in (o for o in objects if o.type == 'MESH'):
+            if obj.modifiers and any(m.show_viewport for m in obj.modifiers):
+                objects_with_modifiers.append(obj.name)
             
             for mat_slot in obj.material_slots:
-                if not mat_slot.material:
-                    continue
-                
                 mat = mat_slot.material
-                if mat.name in checked:
+                if not mat:
+                    continue
+                # as_pointer() dedup: one C call and an int hash, versus
+                # an RNA string fetch plus string hash for mat.name
+                ptr = mat.as_pointer()
+                if ptr in checked:
                     continue
-                checked.add(mat.name)
+                checked.add(ptr)
                 
-                # Check material nodes for image textures
-                if mat.use_nodes:
-                    for node in mat.node_tree.nodes:
-                        if node.type == 'TEX_IMAGE' and node.image:
-                            if node.image.packed_file is None:
-                                # Check if external file exists
-                                try:
-                                    if node.image.filepath:
-                                        import os
-                                        filepath = bpy.path.abspath(node.image.filepath)
-                                        if not os.path.exists(filepath):
-                                            missing.append(node.image.name)
-                                except:
-                                    missing.append(node.image.name)
-        
-        return missing
+                if not mat.use_nodes:
+                    continue
+                for node in mat.node_tree.nodes:
+                    if node.type == 'TEX_IMAGE' and node.image:
+                        image = node.image
+                        image_ptr = image.as_pointer()
+                        if image_ptr in seen_images:
+                            continue
+                        seen_images.add(image_ptr)
+                        
+                        width, height = image.size[0], image.size[1]
+                        if max(width, height) > config.WARN_TEXTURE_SIZE:
+                            large_textures[image.name] = (width, height)
+                        
+                        if image.packed_file is None:
+                            try:
+                                if image.filepath:
+                                    filepath = bpy.path.abspath(image.filepath)
+                                    exists = path_exists.get(filepath)
+                                    if exists is None:
+                                        exists = os.path.exists(filepath)
+                                        path_exists[filepath] = exists
+                                    if not exists:
+                                        missing.append(image.name)
+                            except:
+                                missing.append(image.name)
+        
+        result = (missing, large_textures, objects_with_modifiers)
+        _material_scan_cache[cache_key] = result
+        return result
+    
+    @staticmethod
+    def check_missing_textures(objects):
+        """
+        Check for missing texture files.
+        
+        Args:
+            objects: List of objects to check
+            
+        Returns:
+            list: Names of missing textures
+        """
+        return ValidationHelper._scan_materials(objects)[0]
     
     @staticmethod
     def check_modifiers(objects):
@@ -119,16 +247,7 @@ class ValidationHelper:
         Returns:
             list: Names of objects with modifiers
         """
-        objects_with_modifiers = []
-        
-        for obj in objects:
-            if obj.type == 'MESH' and obj.modifiers:
-                # Check for visible modifiers
-                visible_modifiers = [m for m in obj.modifiers if m.show_viewport]
-                if visible_modifiers:
-                    objects_with_modifiers.append(obj.name)
-        
-        return objects_with_modifiers
+        return ValidationHelper._scan_materials(objects)[2]
     
     @staticmethod
     def check_texture_sizes(objects):
@@ -141,42 +260,17 @@ class ValidationHelper:
         Returns:
             dict: Textures exceeding size limits
         """
-        large_textures = {}
-        checked = set()
-        
-        for obj in objects:
-            if obj.type != 'MESH':
-                continue
-            
-            for mat_slot in obj.material_slots:
-                if not mat_slot.material:
-                    continue
-                
-                mat = mat_slot.material
-                if mat.name in checked:
-                    continue
-                checked.add(mat.name)
-                
-                if mat.use_nodes:
-                    for node in mat.node_tree.nodes:
-                        if node.type == 'TEX_IMAGE' and node.image:
-                            width = node.image.size[0]
-                            height = node.image.size[1]
-                            max_dim = max(width, height)
-                            
-                            if max_dim > config.WARN_TEXTURE_SIZE:
-                                large_textures[node.image.name] = (width, height)
-        
-        return large_textures
+        return ValidationHelper._scan_materials(objects)[1]
     
     @staticmethod
-    def validate_for_preset(objects, preset_name):
+    def validate_for_preset(objects, preset_name, mesh_stats=None):
         """
         Validate objects against a specific export preset.
         
         Args:
             objects: List of objects to validate
             preset_name: Name of the preset to validate against
+            mesh_stats: Optional precomputed stats from get_mesh_stats()
             
         Returns:
             tuple: (is_valid, warnings, errors)
@@ -188,8 +282,11 @@ class ValidationHelper:
         warnings = []
         errors = []
         
+        if mesh_stats is None:
+            mesh_stats = ValidationHelper.get_mesh_stats(objects)
+        
         # Basic validation first
-        is_valid, base_warnings, base_errors = ValidationHelper.validate_selection(objects)
+        is_valid, base_warnings, base_errors = ValidationHelper.validate_selection(objects, mesh_stats)
         warnings.extend(base_warnings)
         errors.extend(base_errors)
         
@@ -206,8 +303,7 @@ class ValidationHelper:
                 )
         
         # Check poly count for preset
-        from .glb_exporter import GLBExporter
-        poly_count = GLBExporter.get_poly_count(objects)
+        poly_count = sum(mesh_stats[obj][0] for obj in objects if obj in mesh_stats)
         
         if preset_name == 'mobile_vr' and poly_count > config.MAX_POLY_COUNT_MOBILE_VR:
             warnings.append(f"Polygon count ({poly_count:,}) exceeds mobile VR recommendation")
@@ -63,22 +63,21 @@ def diagnose_addon():
         print(f"  Module: {prefs_module}")
         
         # Check for the class
-        if hasattr(prefs_module, 'BanterUploaderPreferences'):
-            print(f"✓ BanterUploaderPreferences class found")
-            pref_class = prefs_module.BanterUploaderPreferences
+        if hasattr(prefs_module, 'TippyUploaderPreferences'):
+            print(f"✓ TippyUploaderPreferences class found")
+            pref_class = prefs_module.TippyUploaderPreferences
             print(f"  Class: {pref_class}")
             print(f"  bl_idname: {pref_class.bl_idname}")
             
-            # Check properties
+            # Check properties: bpy.props definitions live in
+            # __annotations__, so read that dict directly instead of
+            # getattr-probing every name dir() returns
             print(f"\n  Checking properties:")
-            for attr_name in dir(pref_class):
-                if not attr_name.startswith('_'):
-                    attr = getattr(pref_class, attr_name, None)
-                    if hasattr(attr, '__class__'):
-                        if 'Property' in attr.__class__.__name__:
-                            print(f"    - {attr_name}: {attr.__class__.__name__}")
+            for name, annotation in getattr(pref_class, '__annotations__', {}).items():
+                if 'Property' in type(annotation).__name__:
+                    print(f"    - {name}: {type(annotation).__name__}")
         else:
-            print(f"✗ BanterUploaderPreferences class not found")
+            print(f"✗ TippyUploaderPreferences class not found")
             
     except Exception as e:
         print(f"✗ Error with preferences module: {e}")
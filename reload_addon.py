@@ -9,6 +9,7 @@ Usage:
 """
 
 import bpy
+import os
 import sys
 import importlib
 from pathlib import Path
@@ -56,9 +57,13 @@ def reload_addon():
     
     print("="*50 + "\n")
 
+# Source mtimes as of the last deep reload, so unchanged modules skip
+# their importlib.reload entirely
+_last_reload_mtimes = {}
+
 # Alternative method using importlib (more thorough)
 def deep_reload_addon():
-    """Deep reload of addon and all submodules"""
+    """Deep reload of addon submodules that changed on disk"""
     
     addon_name = "blender_banter_uploader"
     
@@ -70,34 +75,32 @@ def deep_reload_addon():
     if addon_name in bpy.context.preferences.addons:
         bpy.ops.preferences.addon_disable(module=addon_name)
     
-    # Get the addon module
-    if addon_name in sys.modules:
-        addon_module = sys.modules[addon_name]
-        
-        # Reload all submodules
-        submodules = [
-            'config',
-            'preferences',
-            'operators',
-            'operators.export_upload',
-            'operators.batch_export',
-            'panels',
-            'panels.ui_panel',
-            'utils',
-            'utils.glb_exporter',
-            'utils.http_client',
-            'utils.validation',
-        ]
-        
-        for submodule_name in submodules:
-            full_name = f"{addon_name}.{submodule_name}"
-            if full_name in sys.modules:
-                importlib.reload(sys.modules[full_name])
-                print(f"✓ Reloaded: {submodule_name}")
-        
-        # Reload main module
-        importlib.reload(addon_module)
-        print(f"✓ Reloaded main module")
+    # Discover loaded addon modules instead of hard-coding the list, so
+    # new submodules are picked up automatically. Deepest names reload
+    # first (leaves before the packages that import them), with the
+    # main module last.
+    mods = [
+        (name, module) for name, module in list(sys.modules.items())
+        if name.startswith(addon_name) and getattr(module, '__file__', None)
+    ]
+    mods.sort(key=lambda item: item[0].count('.'), reverse=True)
+    
+    reloaded = 0
+    for name, module in mods:
+        try:
+            mtime = os.path.getmtime(module.__file__)
+        except OSError:
+            continue
+        # Only reload files actually edited since the last pass
+        if mtime <= _last_reload_mtimes.get(name, 0.0):
+            continue
+        importlib.reload(module)
+        _last_reload_mtimes[name] = mtime
+        reloaded += 1
+        print(f"✓ Reloaded: {name}")
+    
+    if not reloaded:
+        print("  No modules changed on disk")
     
     # Re-enable addon
     bpy.ops.preferences.addon_enable(module=addon_name)